@@ -39,10 +39,42 @@ import struct
 import sys
 import binascii
 import math
+import operator
 import datetime
 import re
 import os
 import collections
+import concurrent.futures
+import functools
+import itertools
+
+try:
+    # optional - the C extension of crcmod gives a much faster crc16
+    import crcmod
+    import crcmod._crcfunext
+except ImportError:
+    crcmod = None
+
+try:
+    # optional - numba can compile the crc16 loop if crcmod is not available
+    import numba
+except ImportError:
+    numba = None
+
+
+class _SentinelDict(dict):
+    """
+    Lookup table dict that returns a fixed default for missing keys. Unlike a
+    defaultdict, looking up a missing key does not add it to the table.
+    """
+    __slots__ = ('default',)
+
+    def __init__(self, default, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.default = default
+
+    def __missing__(self, key):
+        return self.default
 
 
 class NPIF_Error():
@@ -57,6 +89,7 @@ class NPIF_Error():
         self.errorcount = 0         # 0 no errors, >0 has errors
         self.errorinfo = []         # array of 3 element tuples
             # error category, error seriousness, error string
+        self.errorindex = {}        # error category -> indexes in errorinfo
         self.maxerrorlevel = 0      # largest value in errorlevel array
 
     # error seriousness constants
@@ -129,7 +162,7 @@ class NPIF_Error():
 
     # for each of the error types a chunk of text to indicate what is being checked for
     # should be an entry for everything in ETYPES
-    ETYPES_TXT = collections.defaultdict (lambda: "Checking for <Unrecognised Error Type> ...", {
+    ETYPES_TXT = _SentinelDict("Checking for <Unrecognised Error Type> ...", {
         E_HEADCRC: "Checking for any errors in Header CRC values ...",
         E_HEADLEN: "Checking for packet headers that are too short ...",
         E_EDITION: "Checking for packets with invalid Edition numbers ...",
@@ -191,6 +224,7 @@ class NPIF_Error():
             elevel = self.ELVL_HIGH  # default to most serious
 
         self.errorinfo.append((etype, elevel, str(etext)))
+        self.errorindex.setdefault(etype, []).append(self.errorcount)
 
         self.errorcount += 1
         if elevel > self.maxerrorlevel:
@@ -225,7 +259,7 @@ class NPIF_Error():
         instances of an error matching this type are.
         If none are found it returns an empty list.
         """
-        return [i for i,z in enumerate(self.errorinfo) if z[0] == etype]
+        return list(self.errorindex.get(etype, ()))
 
     def printerrors(self, obuf=sys.stdout, strictcsv=False):
         """
@@ -269,15 +303,15 @@ class NPIF_Error():
         else:
             outstring = "{0},{1}\n"
 
-        for etype, lvl, txt in self.errorinfo:
-            if etype == errtype:
-                if lvl == self.ELVL_WARN:
-                    firstbit = "WARNING:"
-                    wcount += 1
-                else:
-                    firstbit = "ERROR:"
-                    ecount += 1
-                obuf.write(outstring.format(firstbit, txt))
+        for i in self.errorindex.get(errtype, ()):
+            etype, lvl, txt = self.errorinfo[i]
+            if lvl == self.ELVL_WARN:
+                firstbit = "WARNING:"
+                wcount += 1
+            else:
+                firstbit = "ERROR:"
+                ecount += 1
+            obuf.write(outstring.format(firstbit, txt))
         return (wcount, ecount)
 
 
@@ -285,6 +319,15 @@ class NPIF_Header():
     """
     Defines a set of info relevant to packet header.
     """
+    # one of these per packet, so fix the attribute layout
+    __slots__ = ('edition', 'compressflag', 'crcflag', 'ambleflag',
+        'segmentnum', 'sourceaddress', 'datafileaddress', 'datafilesize',
+        'datafilenum', 'timetag', 'synctype', 'reserved', 'headcrc',
+        'Requester_Idx_Num', 'Group_ID_Num', 'Event_ID_Num', 'Segment_ID_Num',
+        'Location_ID_Num', 'Target_ID_Num', 'Gimbal_ID_Num', 'Sensor_ID_Num',
+        'Platform_ID_Num', 'tablecode', 'sourcecode', 'errors', 'totlen',
+        'claimlen', 'extraraw', 'packetnum', 'blockdataextract', 'tablename')
+
     def __init__(self):
         """
         Initialises a set of class attributes to default values.
@@ -336,6 +379,11 @@ class NPIF_DataContent():
     Defines a set of info relevant to data in a packet.
     Excludes header data.
     """
+    # one of these per packet, so fix the attribute layout
+    __slots__ = ('dataraw', 'datacrc', 'errors', 'numfieldsrepeating',
+        'numrepeats', 'fieldnames', 'fieldtypes', 'fieldfuncs', 'fieldlflags',
+        'fieldreqs', 'data_flens', 'tcontents')
+
     def __init__(self):
         """
         Initialises a set of class attributes to default values.
@@ -2161,6 +2209,10 @@ class NPIF():
     # Now follows a set of conversion functions, whch generally convert a raw value into a more readable form
     ##############################################################################
     
+    # precompiled formats for Conv_DTG and Conv_Real
+    _DTG_STRUCT = struct.Struct('>H4BH')
+    _REAL_STRUCT = struct.Struct('>d')
+
     def Conv_DTG(self, dtg):
         """
         Given a buffer containing the 7023 encoded date-time info, return a
@@ -2173,7 +2225,7 @@ class NPIF():
             return self.TXT_NULL
         else:
             #
-            f = struct.unpack('>H4BH', dtg[0:8])
+            f = self._DTG_STRUCT.unpack(dtg)
             year = f[0]
             month = f[1]
             day = f[2]
@@ -2209,7 +2261,7 @@ class NPIF():
         Return a 8 byte real number (double) from the 7023 data.
         Returns NULL text if appropriate
         """
-        a = struct.unpack('>d', indat)[0]
+        a = self._REAL_STRUCT.unpack(indat)[0]
         if math.isnan(a):
             return self.TXT_NULL
         else:
@@ -2353,6 +2405,11 @@ class NPIF():
         else:
             return indat
 
+    # radians to degrees factor (as used by math.degrees) and pi, for the
+    # Conv_Degrees functions
+    _RAD2DEG = 180.0 / math.pi
+    _PI = math.pi
+
     def Conv_Degrees(self, angle):
         """
         Convert radians to degrees after checking for NULL values and out
@@ -2361,9 +2418,9 @@ class NPIF():
         if angle == self.TXT_NULL:
             return self.TXT_NULL
         else:
-            a = math.degrees(angle)
+            a = angle * self._RAD2DEG
             # check for out of range angles
-            if angle >= -math.pi and angle < math.pi:
+            if -self._PI <= angle < self._PI:
                 return a
             else:
                 return str(a) + ", " + self.TXT_BAD_ANGLE
@@ -2377,9 +2434,9 @@ class NPIF():
         if angle == self.TXT_NULL:
             return self.TXT_NULL
         else:
-            a = math.degrees(angle)
+            a = angle * self._RAD2DEG
             # check for out of range angles
-            if angle >= 0 and angle <= math.pi:
+            if 0 <= angle <= self._PI:
                 return a
             else:
                 return str(a) + ", " + self.TXT_SUS_VALUE
@@ -2394,9 +2451,9 @@ class NPIF():
         if angle == self.TXT_NULL:
             return self.TXT_NULL
         else:
-            a = math.degrees(angle)
+            a = angle * self._RAD2DEG
             # check for out of range angles
-            if angle >= -math.pi and angle <= math.pi:
+            if -self._PI <= angle <= self._PI:
                 return a
             else:
                 return str(a) + ", " + self.TXT_SUS_VALUE
@@ -2409,7 +2466,7 @@ class NPIF():
         if angle == self.TXT_NULL:
             return self.TXT_NULL
         else:
-            return math.degrees(angle)
+            return angle * self._RAD2DEG
 
     def Conv_JPEG_PqTq(self, inint):
         """
@@ -2441,13 +2498,15 @@ class NPIF():
         v = u + " " + t
         return v
 
+    # precompiled format for Conv_Hufflengths
+    _HUFFLEN_STRUCT = struct.Struct('>16B')
+
     def Conv_Hufflengths(self, buff):
         """
         Given a buffer containing the 16 raw huffman values, return a 16
         element list with the lengths as integers
         """
-        nl = struct.unpack('>16B', buff)
-        return list(nl)
+        return list(self._HUFFLEN_STRUCT.unpack(buff))
 
     def Conv_notinuse(self, invalue):
         """
@@ -2499,7 +2558,7 @@ class NPIF():
     SA_BAD = 11  # Genric code for a bad value
 
     # Data: linking source address codes to their textual description
-    SA_INFO = collections.defaultdict (lambda: "Unrecognised Source Address", {
+    SA_INFO = _SentinelDict("Unrecognised Source Address", {
         SA_Format_Description_Data: "Format Description",
         SA_Mission_Data: "Mission",
         SA_Target_Data: "Target",
@@ -2679,7 +2738,7 @@ class NPIF():
         DT_Comp_Dynamic_Plat_DT)
 
     # Data: Table names
-    S7023_TABLE_NAMES = collections.defaultdict (lambda: "Unrecognised Table", {
+    S7023_TABLE_NAMES = _SentinelDict("Unrecognised Table", {
         DT_Format_Time_Tag_DT: "Format Time Tag",
         DT_General_Admin_Ref_DT: "General Administrative Reference",
         DT_Mission_Security_DT: "Mission Security",
@@ -2745,7 +2804,7 @@ class NPIF():
 
     # Data: Table size in bytes - Tuple of min and max
     # ignores sync code and packet header
-    S7023_TABLE_SIZES = collections.defaultdict (lambda: (0, 0), {
+    S7023_TABLE_SIZES = _SentinelDict((0, 0), {
         DT_Format_Time_Tag_DT: (8, 8),
         DT_General_Admin_Ref_DT: (20, 20),
         DT_Mission_Security_DT: (1156, 1156),
@@ -2815,7 +2874,7 @@ class NPIF():
     # NB things marked as 8+8 are coordinates
     # A "v" means this list has variable length - code will need to work these
     # out based on the data packet
-    S7023_FLD_LENGTHS = collections.defaultdict (lambda: (), {
+    S7023_FLD_LENGTHS = _SentinelDict((), {
         DT_Format_Time_Tag_DT: (8, ),
         DT_General_Admin_Ref_DT: (8, 8, 2, 1, 1),
         DT_Mission_Security_DT: (64, 8, 60, 1024),
@@ -2890,7 +2949,7 @@ class NPIF():
     })
 
     # Data: Data Types for each field in a table
-    S7023_FLD_TYPES = collections.defaultdict (lambda: (), {
+    S7023_FLD_TYPES = _SentinelDict((), {
         DT_Format_Time_Tag_DT: ('r',),
         DT_General_Admin_Ref_DT: ('a', 'd', 'a', 'j', 'i'),
         DT_Mission_Security_DT: ('a', 'd', 'a', 'a'),
@@ -2961,7 +3020,7 @@ class NPIF():
 
     # Data: Field Requirements - whether each field is Mandatory, Conditional
     # or Optional
-    S7023_FLD_REQS = collections.defaultdict (lambda: (), {
+    S7023_FLD_REQS = _SentinelDict((), {
         DT_Format_Time_Tag_DT: ('m',),
         DT_General_Admin_Ref_DT: ('m', 'm', 'o', 'm', 'm'),
         DT_Mission_Security_DT: ('m', 'o', 'o', 'o'),
@@ -3031,7 +3090,7 @@ class NPIF():
     })
 
     # Data: Names of the fields in each of the given tables (in order)
-    S7023_FLD_NAMES = collections.defaultdict (lambda: (), {
+    S7023_FLD_NAMES = _SentinelDict((), {
         DT_Format_Time_Tag_DT: ('Tick Value',),
         DT_General_Admin_Ref_DT: (
             'Mission Number', 'Mission Start Time', 'Project Identifier Code',
@@ -3263,10 +3322,13 @@ class NPIF():
         DT_JPEG2000_Index_DT: ('Highest order of progression index',),
         DT_BAD_DT: ()
     })
+    # field names are the keys of every tcontents dict, so intern them
+    S7023_FLD_NAMES = _SentinelDict((), {tc: tuple(map(sys.intern, names))
+        for tc, names in S7023_FLD_NAMES.items()})
 
     # Data : Field 'list' Flags - fields flagged with a '1' may have repeating
     # elements. These will be handled as lists.
-    S7023_FLD_LIST_FLAGS = collections.defaultdict (lambda: (), {
+    S7023_FLD_LIST_FLAGS = _SentinelDict((), {
         DT_Format_Time_Tag_DT: (0,),
         DT_General_Admin_Ref_DT: (0,) * 5,
         DT_Mission_Security_DT: (0,) * 4,
@@ -3332,7 +3394,7 @@ class NPIF():
 
     # Data: linking tables to a text string containing the variable name
     # not used by the code, but possibly useful for code refactoring
-    _VARIABLE_NAMES = collections.defaultdict (lambda: "Not Applicable", {
+    _VARIABLE_NAMES = _SentinelDict("Not Applicable", {
         DT_Format_Time_Tag_DT: "DT_Format_Time_Tag_DT",
         DT_General_Admin_Ref_DT: "DT_General_Admin_Ref_DT",
         DT_Mission_Security_DT: "DT_Mission_Security_DT",
@@ -3398,7 +3460,7 @@ class NPIF():
 
     # Data: any additional functions which should be run on the data fields
     # 'None' means no additional functions
-    S7023_FLD_FUNCS = collections.defaultdict (lambda: (), {
+    S7023_FLD_FUNCS = _SentinelDict((), {
         DT_Format_Time_Tag_DT: (None,),
         DT_General_Admin_Ref_DT: (None,) * 5,
         DT_Mission_Security_DT: (None,) * 4,
@@ -3527,6 +3589,94 @@ class NPIF():
     })
     ###################################################################################
 
+# crc-16 lookup table (see Tabledata.crc16)
+_CRC16_TAB = (
+    0x0000, 0x8005, 0x800f, 0x000a, 0x801b, 0x001e, 0x0014, 0x8011,
+    0x8033, 0x0036, 0x003c, 0x8039, 0x0028, 0x802d, 0x8027, 0x0022,
+    0x8063, 0x0066, 0x006c, 0x8069, 0x0078, 0x807d, 0x8077, 0x0072,
+    0x0050, 0x8055, 0x805f, 0x005a, 0x804b, 0x004e, 0x0044, 0x8041,
+    0x80c3, 0x00c6, 0x00cc, 0x80c9, 0x00d8, 0x80dd, 0x80d7, 0x00d2,
+    0x00f0, 0x80f5, 0x80ff, 0x00fa, 0x80eb, 0x00ee, 0x00e4, 0x80e1,
+    0x00a0, 0x80a5, 0x80af, 0x00aa, 0x80bb, 0x00be, 0x00b4, 0x80b1,
+    0x8093, 0x0096, 0x009c, 0x8099, 0x0088, 0x808d, 0x8087, 0x0082,
+    0x8183, 0x0186, 0x018c, 0x8189, 0x0198, 0x819d, 0x8197, 0x0192,
+    0x01b0, 0x81b5, 0x81bf, 0x01ba, 0x81ab, 0x01ae, 0x01a4, 0x81a1,
+    0x01e0, 0x81e5, 0x81ef, 0x01ea, 0x81fb, 0x01fe, 0x01f4, 0x81f1,
+    0x81d3, 0x01d6, 0x01dc, 0x81d9, 0x01c8, 0x81cd, 0x81c7, 0x01c2,
+    0x0140, 0x8145, 0x814f, 0x014a, 0x815b, 0x015e, 0x0154, 0x8151,
+    0x8173, 0x0176, 0x017c, 0x8179, 0x0168, 0x816d, 0x8167, 0x0162,
+    0x8123, 0x0126, 0x012c, 0x8129, 0x0138, 0x813d, 0x8137, 0x0132,
+    0x0110, 0x8115, 0x811f, 0x011a, 0x810b, 0x010e, 0x0104, 0x8101,
+    0x8303, 0x0306, 0x030c, 0x8309, 0x0318, 0x831d, 0x8317, 0x0312,
+    0x0330, 0x8335, 0x833f, 0x033a, 0x832b, 0x032e, 0x0324, 0x8321,
+    0x0360, 0x8365, 0x836f, 0x036a, 0x837b, 0x037e, 0x0374, 0x8371,
+    0x8353, 0x0356, 0x035c, 0x8359, 0x0348, 0x834d, 0x8347, 0x0342,
+    0x03c0, 0x83c5, 0x83cf, 0x03ca, 0x83db, 0x03de, 0x03d4, 0x83d1,
+    0x83f3, 0x03f6, 0x03fc, 0x83f9, 0x03e8, 0x83ed, 0x83e7, 0x03e2,
+    0x83a3, 0x03a6, 0x03ac, 0x83a9, 0x03b8, 0x83bd, 0x83b7, 0x03b2,
+    0x0390, 0x8395, 0x839f, 0x039a, 0x838b, 0x038e, 0x0384, 0x8381,
+    0x0280, 0x8285, 0x828f, 0x028a, 0x829b, 0x029e, 0x0294, 0x8291,
+    0x82b3, 0x02b6, 0x02bc, 0x82b9, 0x02a8, 0x82ad, 0x82a7, 0x02a2,
+    0x82e3, 0x02e6, 0x02ec, 0x82e9, 0x02f8, 0x82fd, 0x82f7, 0x02f2,
+    0x02d0, 0x82d5, 0x82df, 0x02da, 0x82cb, 0x02ce, 0x02c4, 0x82c1,
+    0x8243, 0x0246, 0x024c, 0x8249, 0x0258, 0x825d, 0x8257, 0x0252,
+    0x0270, 0x8275, 0x827f, 0x027a, 0x826b, 0x026e, 0x0264, 0x8261,
+    0x0220, 0x8225, 0x822f, 0x022a, 0x823b, 0x023e, 0x0234, 0x8231,
+    0x8213, 0x0216, 0x021c, 0x8219, 0x0208, 0x820d, 0x8207, 0x0202)
+
+
+if numba is not None:
+    @numba.njit
+    def _crc16_jit(buf):
+        """
+        Byte-wise table crc-16 loop of Tabledata.crc16, compiled by numba
+        (on the first call). buf must be a bytes object.
+        """
+        tab = _CRC16_TAB
+        crc = 0
+        for ch in buf:
+            crc = (tab[((crc >> 8) ^ ch) & 0xff] ^ (crc << 8)) & 0xffff
+        return crc
+else:
+    _crc16_jit = None
+
+
+def _crc16_slice_tables(tab):
+    """
+    Given the byte-wise crc-16 lookup table, returns a tuple of 8 tables for
+    processing 8 bytes at a time. Table k gives the crc contribution of a byte
+    followed by k zero bytes (table 0 is tab itself).
+    """
+    tabs = [tuple(tab)]
+    for _ in range(7):
+        prev = tabs[-1]
+        tabs.append(tuple(((v << 8) & 0xffff) ^ tab[v >> 8] for v in prev))
+    return tuple(tabs)
+
+
+@functools.lru_cache(maxsize=256)
+def _field_splitter(flens):
+    """
+    Returns a (cached) struct.Struct that splits a buffer into byte strings
+    with the lengths given in the tuple flens. Used by SplitFields.
+    Returns None if any length is negative (possible with malformed tables).
+    """
+    if any(n < 0 for n in flens):
+        return None
+    return struct.Struct('>' + ''.join('%ds' % n for n in flens))
+
+
+@functools.lru_cache(maxsize=256)
+def _mandatory_fields(ftypes, freqs):
+    """
+    Returns a (cached) tuple of (index, type) pairs for the mandatory fields
+    of a table whose type can be checked for NULL values, given the tuples
+    of field types and field requirements. Used by Check_DT_Mand_Fields.
+    """
+    return tuple((i, t) for i, (t, r) in enumerate(zip(ftypes, freqs))
+        if r == 'm' and t in ('a', 'r', 'i', 'j', 'd', 'c'))
+
+
 class Tabledata(NPIF):
     """
     Creates a class capable of converting, extracting and manupulating
@@ -3552,6 +3702,17 @@ class Tabledata(NPIF):
         """
         # buff is in binary, flist is in bytes, -
         # check that buff is big enough, adding in crc size if appropriate
+        if isinstance(buff, bytes):
+            # one precompiled unpack does the whole split
+            nflist = tuple(flist)
+            if crcflag != 0:
+                nflist += (2, )
+            splitter = _field_splitter(nflist)
+            if splitter is not None:
+                if len(buff) < splitter.size:
+                    # buffer is not long enough. Return empty list.
+                    return []
+                return list(splitter.unpack_from(buff))
         nflist = list(flist)
         if crcflag != 0:
             nflist.append(2)
@@ -3573,50 +3734,48 @@ class Tabledata(NPIF):
                 start = i
         return nlist
 
+    # precompiled layout of the fixed 32 byte packet header (after the sync)
+    _HDR_STRUCT = struct.Struct('>4B3IQB5s2s')
+    # crc-16 lookup table, see crc16
+    CRC16_TAB = _CRC16_TAB
+    # slice-by-8 versions of CRC16_TAB, see crc16
+    _CRC16_SLICES = _crc16_slice_tables(CRC16_TAB)
+    # crc16 function from the crcmod C extension (None if not available)
+    _crc16_c = (staticmethod(crcmod.mkCrcFun(0x18005, initCrc=0, rev=False,
+        xorOut=0)) if crcmod is not None else None)
+    # numba compiled crc16 loop (None if not available)
+    _crc16_nb = staticmethod(_crc16_jit) if _crc16_jit is not None else None
+
     def crc16(self, s):
         """
         Calculate the crc-16 as specified in the standard. Lookup table (and c
         code) derived from pycrc v0.8.1 with the following parameters:
         width 16, poly 0x8005, reflect-in 0, reflect-out 0, xor-in 0, xor-out 0
         Returns a string with uppercase hex values.
+
+        Uses the C extension of crcmod for the calculation if it is installed,
+        otherwise a numba compiled loop if numba is installed.
         """
+        if self._crc16_c is not None:
+            return '%04X' % self._crc16_c(s)
+        if self._crc16_nb is not None:
+            # the compiled loop is typed for bytes, copy any other buffer
+            if not isinstance(s, bytes):
+                s = bytes(s)
+            return '%04X' % self._crc16_nb(s)
         crcValue = 0x0000
-        crc16tab = (
-            0x0000, 0x8005, 0x800f, 0x000a, 0x801b, 0x001e, 0x0014, 0x8011,
-            0x8033, 0x0036, 0x003c, 0x8039, 0x0028, 0x802d, 0x8027, 0x0022,
-            0x8063, 0x0066, 0x006c, 0x8069, 0x0078, 0x807d, 0x8077, 0x0072,
-            0x0050, 0x8055, 0x805f, 0x005a, 0x804b, 0x004e, 0x0044, 0x8041,
-            0x80c3, 0x00c6, 0x00cc, 0x80c9, 0x00d8, 0x80dd, 0x80d7, 0x00d2,
-            0x00f0, 0x80f5, 0x80ff, 0x00fa, 0x80eb, 0x00ee, 0x00e4, 0x80e1,
-            0x00a0, 0x80a5, 0x80af, 0x00aa, 0x80bb, 0x00be, 0x00b4, 0x80b1,
-            0x8093, 0x0096, 0x009c, 0x8099, 0x0088, 0x808d, 0x8087, 0x0082,
-            0x8183, 0x0186, 0x018c, 0x8189, 0x0198, 0x819d, 0x8197, 0x0192,
-            0x01b0, 0x81b5, 0x81bf, 0x01ba, 0x81ab, 0x01ae, 0x01a4, 0x81a1,
-            0x01e0, 0x81e5, 0x81ef, 0x01ea, 0x81fb, 0x01fe, 0x01f4, 0x81f1,
-            0x81d3, 0x01d6, 0x01dc, 0x81d9, 0x01c8, 0x81cd, 0x81c7, 0x01c2,
-            0x0140, 0x8145, 0x814f, 0x014a, 0x815b, 0x015e, 0x0154, 0x8151,
-            0x8173, 0x0176, 0x017c, 0x8179, 0x0168, 0x816d, 0x8167, 0x0162,
-            0x8123, 0x0126, 0x012c, 0x8129, 0x0138, 0x813d, 0x8137, 0x0132,
-            0x0110, 0x8115, 0x811f, 0x011a, 0x810b, 0x010e, 0x0104, 0x8101,
-            0x8303, 0x0306, 0x030c, 0x8309, 0x0318, 0x831d, 0x8317, 0x0312,
-            0x0330, 0x8335, 0x833f, 0x033a, 0x832b, 0x032e, 0x0324, 0x8321,
-            0x0360, 0x8365, 0x836f, 0x036a, 0x837b, 0x037e, 0x0374, 0x8371,
-            0x8353, 0x0356, 0x035c, 0x8359, 0x0348, 0x834d, 0x8347, 0x0342,
-            0x03c0, 0x83c5, 0x83cf, 0x03ca, 0x83db, 0x03de, 0x03d4, 0x83d1,
-            0x83f3, 0x03f6, 0x03fc, 0x83f9, 0x03e8, 0x83ed, 0x83e7, 0x03e2,
-            0x83a3, 0x03a6, 0x03ac, 0x83a9, 0x03b8, 0x83bd, 0x83b7, 0x03b2,
-            0x0390, 0x8395, 0x839f, 0x039a, 0x838b, 0x038e, 0x0384, 0x8381,
-            0x0280, 0x8285, 0x828f, 0x028a, 0x829b, 0x029e, 0x0294, 0x8291,
-            0x82b3, 0x02b6, 0x02bc, 0x82b9, 0x02a8, 0x82ad, 0x82a7, 0x02a2,
-            0x82e3, 0x02e6, 0x02ec, 0x82e9, 0x02f8, 0x82fd, 0x82f7, 0x02f2,
-            0x02d0, 0x82d5, 0x82df, 0x02da, 0x82cb, 0x02ce, 0x02c4, 0x82c1,
-            0x8243, 0x0246, 0x024c, 0x8249, 0x0258, 0x825d, 0x8257, 0x0252,
-            0x0270, 0x8275, 0x827f, 0x027a, 0x826b, 0x026e, 0x0264, 0x8261,
-            0x0220, 0x8225, 0x822f, 0x022a, 0x823b, 0x023e, 0x0234, 0x8231,
-            0x8213, 0x0216, 0x021c, 0x8219, 0x0208, 0x820d, 0x8207, 0x0202)
-        for ch in s:
+        t0, t1, t2, t3, t4, t5, t6, t7 = self._CRC16_SLICES
+        # take 8 bytes per step - only the first 2 mix with the running crc
+        n = len(s)
+        end = n - (n & 7)
+        it = iter(s[:end])
+        for b0, b1, b2, b3, b4, b5, b6, b7 in zip(it, it, it, it, it, it, it, it):
+            crcValue = (t7[(crcValue >> 8) ^ b0] ^ t6[(crcValue & 0xff) ^ b1] ^
+                t5[b2] ^ t4[b3] ^ t3[b4] ^ t2[b5] ^ t1[b6] ^ t0[b7])
+        # then any remaining bytes one at a time
+        for ch in s[end:]:
             tbl_idx = ((crcValue >> 8) ^ ch) & 0xff
-            crcValue = (crc16tab[tbl_idx] ^ (crcValue << 8)) & 0xffff
+            crcValue = (t0[tbl_idx] ^ (crcValue << 8)) & 0xffff
         return '%04X' % crcValue
 
     def fieldlengths(self):
@@ -3636,87 +3795,98 @@ class Tabledata(NPIF):
             return loclist
         #
         if loclist[0] == "v":
-            loclist2 = loclist[1:]
-            # check for the known cases (17 in total), and fix those we can
-            if tablecode in [
-                    self.DT_Sensor_Grouping_DT,
-                    self.DT_Sensor_Samp_Timing_Des_DT]:
-                # may contain additional length 1 fields
-                tsize = sum(loclist2)
-                if datasize > tsize:
-                    loclist2 += (1,) * (datasize - tsize)
-                loclist = loclist2
-            elif tablecode in [
-                    self.DT_Sensor_Index_DT,
-                    self.DT_Passive_Sensor_El_DT,
-                    self.DT_RADAR_Element_DT,
-                    self.DT_JPEG2000_Index_DT]:
-                # all fields may get repeated a number of times
-                tsize = sum(loclist2)
-                if datasize > tsize:
-                    loclist3 = loclist2 * (datasize // tsize)
-                else:
-                    loclist3 = loclist2
-                loclist = loclist3
-            elif tablecode == self.DT_Sensor_Samp_Coord_Des_DT:
-                # may repeat all but the 1st element of the pattern
-                tsize = sum(loclist2)
-                ssize = tsize - loclist2[0]
-                loclist3 = (loclist2[0], )
-                pat = loclist2[1:]
-                if datasize > tsize:
-                    loclist3 += pat * ((datasize - loclist2[0]) // ssize)
-                else:
-                    loclist3 = loclist2
-                loclist = loclist3
-            elif tablecode == self.DT_JPEG_Sensor_Quant_DT:
-                # need to pick through table itself to get lengths
-                last = datasize - 2 - 2 - 1
-                # lump everything else into the final field
-                loclist2 = (2, 2, 1, last)
-                loclist = self._JPEG_quant_flengths(loclist2)
-            elif tablecode == self.DT_JPEG_Sensor_Huffman_DT:
-                # need to pick through table itself to get lengths
-                last = datasize - 2 - 2 - 1 - 16
-                loclist2 = (2, 2, 1, 16, last)
-                loclist = self._JPEG_huff_flengths(loclist2)
-            elif tablecode == self.DT_Sensor_DT:
-                # variable sized element repeated multiple times
-                # key tables
-                # 1. Sensor Description Data Table
-                # 2. Sync Hierarchy and Image Build Data Table
-                # 3. Sensor Element Data Table
-                # 4. Sensor Compression Data Table
-                # currently just return the whole lot
-                loclist = (datasize,)
-            elif tablecode in [
-                    self.DT_Sensor_Samp_xCoord_DT,
-                    self.DT_Sensor_Samp_yCoord_DT,
-                    self.DT_Sensor_Samp_zCoord_DT]:
-                # variable sized element repeated multiple times
-                # Sensor Sample Coordinate Description Data Table sets sizes
-                # currently just return the whole lot
-                loclist = (datasize, )
-            elif tablecode == self.DT_Sensor_Samp_Timing_DT:
-                # field has one of two lengths
-                # field may be repeated multiple times
-                # Sensor Sample Timing Description Data Table sets sizes
-                # currently just return the whole lot
-                loclist = (datasize, )
-            elif tablecode in [
-                    self.DT_4607_GMTI_DT,
-                    self.DT_4609_Motion_Imagery_DT,
-                    self.DT_User_Defined_DT]:
-                # variable, and beyond scope of 7023 - treat as the length of
-                # the data
-                loclist = (datasize, )
-            else:
+            # look up the rule for the known variable cases (17 in total)
+            handler = self._VARIABLE_FLENS.get(tablecode)
+            if handler is None:
                 # if this code is properly self consistent, we should never end
                 # up in here...
                 loclist = self.DT_TABLES[self.DT_BAD_DT][1]
+            else:
+                loclist = handler(self, loclist[1:], datasize)
         self.tdat.data_flens = loclist
         return loclist
 
+    def _flens_extra_ones(self, loclist2, datasize):
+        """
+        fieldlengths rule: table may contain additional length 1 fields.
+        """
+        tsize = sum(loclist2)
+        if datasize > tsize:
+            loclist2 += (1,) * (datasize - tsize)
+        return loclist2
+
+    def _flens_repeat_all(self, loclist2, datasize):
+        """
+        fieldlengths rule: all fields may get repeated a number of times.
+        """
+        tsize = sum(loclist2)
+        if datasize > tsize:
+            return loclist2 * (datasize // tsize)
+        else:
+            return loclist2
+
+    def _flens_repeat_tail(self, loclist2, datasize):
+        """
+        fieldlengths rule: may repeat all but the 1st element of the pattern.
+        """
+        tsize = sum(loclist2)
+        ssize = tsize - loclist2[0]
+        loclist3 = (loclist2[0], )
+        pat = loclist2[1:]
+        if datasize > tsize:
+            loclist3 += pat * ((datasize - loclist2[0]) // ssize)
+        else:
+            loclist3 = loclist2
+        return loclist3
+
+    def _flens_jpeg_quant(self, loclist2, datasize):
+        """
+        fieldlengths rule: need to pick through JPEG quantisation table itself
+        to get lengths.
+        """
+        last = datasize - 2 - 2 - 1
+        # lump everything else into the final field
+        return self._JPEG_quant_flengths((2, 2, 1, last))
+
+    def _flens_jpeg_huff(self, loclist2, datasize):
+        """
+        fieldlengths rule: need to pick through JPEG Huffman table itself to
+        get lengths.
+        """
+        last = datasize - 2 - 2 - 1 - 16
+        return self._JPEG_huff_flengths((2, 2, 1, 16, last))
+
+    def _flens_whole(self, loclist2, datasize):
+        """
+        fieldlengths rule: return the whole of the data as one field. Used for
+        - variable sized elements repeated multiple times, whose sizes are
+          set in other tables (Sensor, Sensor Sample x/y/z Coordinate and
+          Sensor Sample Timing tables)
+        - data that is variable and beyond the scope of 7023 (4607 GMTI,
+          4609 Motion Imagery and User Defined tables)
+        """
+        return (datasize, )
+
+    # fieldlengths rule for each variable length table
+    _VARIABLE_FLENS = {
+        NPIF.DT_Sensor_Grouping_DT: _flens_extra_ones,
+        NPIF.DT_Sensor_Samp_Timing_Des_DT: _flens_extra_ones,
+        NPIF.DT_Sensor_Index_DT: _flens_repeat_all,
+        NPIF.DT_Passive_Sensor_El_DT: _flens_repeat_all,
+        NPIF.DT_RADAR_Element_DT: _flens_repeat_all,
+        NPIF.DT_JPEG2000_Index_DT: _flens_repeat_all,
+        NPIF.DT_Sensor_Samp_Coord_Des_DT: _flens_repeat_tail,
+        NPIF.DT_JPEG_Sensor_Quant_DT: _flens_jpeg_quant,
+        NPIF.DT_JPEG_Sensor_Huffman_DT: _flens_jpeg_huff,
+        NPIF.DT_Sensor_DT: _flens_whole,
+        NPIF.DT_Sensor_Samp_xCoord_DT: _flens_whole,
+        NPIF.DT_Sensor_Samp_yCoord_DT: _flens_whole,
+        NPIF.DT_Sensor_Samp_zCoord_DT: _flens_whole,
+        NPIF.DT_Sensor_Samp_Timing_DT: _flens_whole,
+        NPIF.DT_4607_GMTI_DT: _flens_whole,
+        NPIF.DT_4609_Motion_Imagery_DT: _flens_whole,
+        NPIF.DT_User_Defined_DT: _flens_whole}
+
     def _JPEG_quant_flengths(self, fl):
         """
         Helper method for fieldlengths method. Works out some of the field
@@ -3726,11 +3896,14 @@ class Tabledata(NPIF):
         # calculate the field lengths by going through the buffer stage by
         # stage and decoding enough info to determine all field lengths
         # fl should be [2,2,1,x] where x is a variable number
+        mv = memoryview(self.tdat.dataraw)
+        # buffer offset of the final (as yet undecoded) field
+        pos = sum(fl[:-1])
         endbit = fl[-1]
         while endbit > 0:
-            # loop through and decode the rest
-            f = self.SplitFields(self.tdat.dataraw, fl, 0)
-            z = self.Conv_Int_NC(f[-2]) >> 4
+            # loop through and decode the rest, using the PqTq byte just
+            # before the final field
+            z = mv[pos - 1] >> 4
             # z allows you to determine the size
             if z == 0:
                 nextentry = 64
@@ -3743,6 +3916,7 @@ class Tabledata(NPIF):
                 fl = f2 + (nextentry, )
             else:
                 fl = f2 + (nextentry, 1, endbit - 1)
+                pos += nextentry + 1
         return fl
 
     def _JPEG_huff_flengths(self, fl):
@@ -3755,11 +3929,14 @@ class Tabledata(NPIF):
         # stage and decoding enough info to determine all field lengths
         # fl should be [2,2,1,16,x] where x is a variable number
         validlengths = (12, 16, 162, 226)
+        mv = memoryview(self.tdat.dataraw)
+        # buffer offset of the final (as yet undecoded) field
+        pos = sum(fl[:-1])
         endbit = fl[-1]
         while endbit > 0:
-            # loop through and decode the rest
-            f = self.SplitFields(self.tdat.dataraw, fl, 0)
-            nextentry = sum(self.Conv_Hufflengths(f[-2]))
+            # loop through and decode the rest, summing the 16 huffman
+            # lengths just before the final field
+            nextentry = sum(mv[pos - 16:pos])
             if nextentry in validlengths:
                 # build up field length array and then loop if still necessary
                 endbit = fl[-1] - nextentry
@@ -3768,6 +3945,7 @@ class Tabledata(NPIF):
                     fl = f2 + (nextentry, )
                 else:
                     fl = f2 + (nextentry, 1, 16, endbit - 17)
+                    pos += nextentry + 1 + 16
             else:
                 # we have bad lengths
                 ptext = ("Packet " + str(self.hdr.packetnum) + "(" +
@@ -3816,6 +3994,45 @@ class Tabledata(NPIF):
         else:
             return self.SA_Urecognised
 
+    # table codes for the single Data File Addresses used with sensor
+    # parametric Source Addresses (64 - 127), see Calc_tablecode
+    _SENPARAM_DFA_CODES = {
+        1: NPIF.DT_PASSIVE_Sensor_Des_DT,
+        2: NPIF.DT_Sensor_Calibration_DT,
+        3: NPIF.DT_Sync_Hier_and_ImBld_DT,
+        4: NPIF.DT_Sensor_Data_Timing_DT,
+        6: NPIF.DT_Sensor_Op_Status_DT,
+        16: NPIF.DT_Sensor_Position_DT,
+        32: NPIF.DT_Min_Sensor_Att_DT,
+        48: NPIF.DT_Comp_Sensor_Att_DT,
+        256: NPIF.DT_Sensor_Compression_DT,
+        257: NPIF.DT_JPEG_Sensor_Quant_DT,
+        258: NPIF.DT_JPEG_Sensor_Huffman_DT,
+        259: NPIF.DT_JPEG2000_Des_DT,
+        260: NPIF.DT_JPEG2000_Index_DT,
+        4096: NPIF.DT_Passive_Sensor_El_DT,
+        4112: NPIF.DT_Sensor_Samp_Coord_Des_DT,
+        4128: NPIF.DT_Sensor_Samp_Timing_Des_DT,
+        65537: NPIF.DT_RADAR_Sensor_Des_DT,
+        66304: NPIF.DT_RADAR_Collect_Plane_ImGeo_DT,
+        66305: NPIF.DT_Reference_Track_DT,
+        66306: NPIF.DT_Rectified_ImGeo_DT,
+        66307: NPIF.DT_Virtual_Sensor_Def_DT,
+        66308: NPIF.DT_RADAR_Parameters_DT,
+        66309: NPIF.DT_ISAR_Track_DT,
+        69632: NPIF.DT_RADAR_Element_DT}
+    # table codes for the Data File Addresses used with sensor data
+    # Source Addresses (128 - 191), see Calc_tablecode
+    _SENSOR_DFA_CODES = {
+        0: NPIF.DT_Sensor_DT,
+        16: NPIF.DT_Sensor_Samp_xCoord_DT,
+        32: NPIF.DT_Sensor_Samp_yCoord_DT,
+        48: NPIF.DT_Sensor_Samp_zCoord_DT,
+        80: NPIF.DT_Sensor_Samp_Timing_DT,
+        96: NPIF.DT_4607_GMTI_DT,
+        112: NPIF.DT_4609_Motion_Imagery_DT,
+        128: NPIF.DT_Range_Finder_DT}
+
     def Calc_tablecode(self, sa=None, dfa=None):
         """
         Given an integer Source Address and Data File Address, return a code
@@ -3897,107 +4114,41 @@ class Tabledata(NPIF):
         elif sa >= 64 and sa <= 127:
             dfa2 = dfa >> 16
             dfa3 = dfa & 65535   # zeros out left half of dfa bits
-            if dfa2 >= 0 and dfa2 <= 64 and dfa3 == 0:
+            code = self._SENPARAM_DFA_CODES.get(dfa)
+            if code is not None:
+                return code
+            elif dfa2 >= 0 and dfa2 <= 64 and dfa3 == 0:
                 return self.DT_Sensor_ID_DT
-            elif dfa == 1:
-                return self.DT_PASSIVE_Sensor_Des_DT
-            elif dfa == 2:
-                return self.DT_Sensor_Calibration_DT
-            elif dfa == 3:
-                return self.DT_Sync_Hier_and_ImBld_DT
-            elif dfa == 4:
-                return self.DT_Sensor_Data_Timing_DT
-            elif dfa == 6:
-                return self.DT_Sensor_Op_Status_DT
-            elif dfa == 16:
-                return self.DT_Sensor_Position_DT
-            elif dfa == 32:
-                return self.DT_Min_Sensor_Att_DT
-            elif dfa == 48:
-                return self.DT_Comp_Sensor_Att_DT
             elif dfa >= 80 and dfa <= 95:
                 return self.DT_Gimbals_Position_DT
             elif dfa >= 96 and dfa <= 111:
                 return self.DT_Min_Gimbals_Att_DT
             elif dfa >= 112 and dfa <= 127:
                 return self.DT_Comp_Gimbals_Att_DT
-            elif dfa == 256:
-                return self.DT_Sensor_Compression_DT
-            elif dfa == 257:
-                return self.DT_JPEG_Sensor_Quant_DT
-            elif dfa == 258:
-                return self.DT_JPEG_Sensor_Huffman_DT
-            elif dfa == 259:
-                return self.DT_JPEG2000_Des_DT
-            elif dfa == 260:
-                return self.DT_JPEG2000_Index_DT
             elif dfa >= 512 and dfa <= 767:
                 return self.DT_Sensor_Index_DT
-            elif dfa == 4096:
-                return self.DT_Passive_Sensor_El_DT
-            elif dfa == 4112:
-                return self.DT_Sensor_Samp_Coord_Des_DT
-            elif dfa == 4128:
-                return self.DT_Sensor_Samp_Timing_Des_DT
-            elif dfa == 65537:
-                return self.DT_RADAR_Sensor_Des_DT
-            elif dfa == 66304:
-                return self.DT_RADAR_Collect_Plane_ImGeo_DT
-            elif dfa == 66305:
-                return self.DT_Reference_Track_DT
-            elif dfa == 66306:
-                return self.DT_Rectified_ImGeo_DT
-            elif dfa == 66307:
-                return self.DT_Virtual_Sensor_Def_DT
-            elif dfa == 66308:
-                return self.DT_RADAR_Parameters_DT
-            elif dfa == 66309:
-                return self.DT_ISAR_Track_DT
-            elif dfa == 69632:
-                return self.DT_RADAR_Element_DT
             else:
                 return self.DT_UNRECOGNISED_DFA_DT
         elif sa >= 128 and sa <= 191:
-            if dfa == 0:
-                return self.DT_Sensor_DT
-            elif dfa == 16:
-                return self.DT_Sensor_Samp_xCoord_DT
-            elif dfa == 32:
-                return self.DT_Sensor_Samp_yCoord_DT
-            elif dfa == 48:
-                return self.DT_Sensor_Samp_zCoord_DT
-            elif dfa == 80:
-                return self.DT_Sensor_Samp_Timing_DT
-            elif dfa == 96:
-                return self.DT_4607_GMTI_DT
-            elif dfa == 112:
-                return self.DT_4609_Motion_Imagery_DT
-            elif dfa == 128:
-                return self.DT_Range_Finder_DT
-            else:
-                return self.DT_UNRECOGNISED_DFA_DT
+            return self._SENSOR_DFA_CODES.get(dfa, self.DT_UNRECOGNISED_DFA_DT)
         elif sa >= 193 and sa <= 255:
             return self.DT_Reserved_DT
         else:
             return self.DT_UNRECOGNISED_SA_DT
 
+    # (ambleflag, crcflag, compressflag) for each value of the header flags
+    # byte, see _calc_headflags
+    _HEADFLAGS = tuple(((n >> 3) & 1, (n >> 2) & 1, (n >> 1) & 1)
+        for n in range(256))
+
     def _calc_headflags(self, intflags):
         """
         Given the int representation of the set of header flags determine
         what flags are set and then set them in the NPIF object.
         """
-        if intflags & 8 == 8:
-            self.hdr.ambleflag = 1
-        else:
-            self.hdr.ambleflag = 0
-        if intflags & 4 == 4:
-            self.hdr.crcflag = 1
-        else:
-            self.hdr.crcflag = 0
-        if intflags & 2 == 2:
-            self.hdr.compressflag = 1
-        else:
-            self.hdr.compressflag = 0
+        hdr = self.hdr
+        hdr.ambleflag, hdr.crcflag, hdr.compressflag = (
+            self._HEADFLAGS[intflags & 0xff])
 
     def extract_header(self, buff, pnum):
         """
@@ -4021,18 +4172,15 @@ class Tabledata(NPIF):
             self.blockdataextract = True
             return
         #
-        f = struct.unpack('>4B3IQB5s2s', buff[0:32])
-        self.hdr.edition = f[0]
-        self._calc_headflags(f[1])
-        self.hdr.segmentnum = f[2]
-        self.hdr.sourceaddress = f[3]
-        self.hdr.datafileaddress = f[4]
-        self.hdr.datafilesize = f[5]
-        self.hdr.datafilenum = f[6]
-        self.hdr.timetag = f[7]
-        self.hdr.synctype = self.Lookup_Sync_Type_Code(f[8])
-        self.hdr.reserved = self.Conv_Hex(f[9])
-        self.hdr.headcrc = self.Conv_Hex(f[10])
+        f = self._HDR_STRUCT.unpack_from(buff)
+        hdr = self.hdr
+        (hdr.edition, flags, hdr.segmentnum, hdr.sourceaddress,
+            hdr.datafileaddress, hdr.datafilesize, hdr.datafilenum,
+            hdr.timetag, sync, reserved, headcrc) = f
+        self._calc_headflags(flags)
+        hdr.synctype = self.Lookup_Sync_Type_Code(sync)
+        hdr.reserved = self.Conv_Hex(reserved)
+        hdr.headcrc = self.Conv_Hex(headcrc)
 
         # start with table code calc as this has info useful to other parts
         self.hdr.tablecode = self.Calc_tablecode()
@@ -4212,6 +4360,29 @@ class Tabledata(NPIF):
             buff[self.HDR_LEN:self.HDR_LEN +
             self.hdr.datafilesize])
 
+    # field plans per table code, filled in by _field_plan on first use
+    _FIELD_PLANS = {}
+
+    def _field_plan(self, tablecode):
+        """
+        Return the fields of a table as (name, conversion, function, list flag)
+        tuples, split into a tuple of the non-repeating fields and a tuple of
+        the repeating fields. The conversion functions are looked up once per
+        table code rather than once per field of every packet.
+        """
+        plan = self._FIELD_PLANS.get(tablecode)
+        if plan is None:
+            convs = self.S7023_F_Conversions
+            tup = [(n, convs[t], fn, lf) for lf, t, n, fn in zip(
+                self.S7023_FLD_LIST_FLAGS[tablecode],
+                self.S7023_FLD_TYPES[tablecode],
+                self.S7023_FLD_NAMES[tablecode],
+                self.S7023_FLD_FUNCS[tablecode])]
+            plan = (tuple(x for x in tup if x[3] == 0),
+                tuple(x for x in tup if x[3] == 1))
+            self._FIELD_PLANS[tablecode] = plan
+        return plan
+
     def extract_data(self, buff, allerr=True):
         """
         Given a raw buffer containing data table info, break out the data.
@@ -4253,10 +4424,8 @@ class Tabledata(NPIF):
         self.tdat.fieldlflags = self.S7023_FLD_LIST_FLAGS[self.hdr.tablecode]
         self.tdat.fieldreqs = self.S7023_FLD_REQS[self.hdr.tablecode]
 
-        fnames = self.tdat.fieldnames
-        ftypes = self.tdat.fieldtypes
-        ffunc = self.tdat.fieldfuncs
         flflag = self.tdat.fieldlflags
+        norep, rep = self._field_plan(self.hdr.tablecode)
 
         flens = self.fieldlengths()
         lfcount1 = self.tdat.fieldlflags.count(1)
@@ -4271,16 +4440,11 @@ class Tabledata(NPIF):
                 self.tdat.errors.adderror(self.tdat.errors.E_DATALEN,
                     self.tdat.errors.ELVL_LOW, ptext +
                     "Table does not have full set of repeated elements")
-            # work out which bits repeat and do not repeat in a, n, lf and func
-            tup = list(zip(flflag, ftypes, fnames, ffunc))
-            norep = [(x, y, z, w) for x, y, z, w in tup if x == 0]
-            rep = [(x, y, z, w) for x, y, z, w in tup if x == 1]
-            # now build new and full versions of a, n, func & lf
+            # fixed fields first, then the repeating fields numrepeats times
             full = norep + rep * numrepeats
-            unfull = list(zip(*full))
-            flflag, ftypes, fnames, ffunc = unfull
             self.tdat.numrepeats = numrepeats
         else:
+            full = norep
             self.tdat.numrepeats = 0
 
         f = self.SplitFields(buff, flens, self.hdr.crcflag)
@@ -4305,33 +4469,30 @@ class Tabledata(NPIF):
                     str(self.tdat.datacrc) + ", calculated value= " +
                     str(calcdcrc) + ")")
         #
-        d = collections.defaultdict(lambda: None)
+        d = collections.defaultdict(type(None))
         if self.tdat.numfieldsrepeating > 0:
             # create blank list entries where necesary
-            for b in fnames[-self.tdat.numfieldsrepeating:]:
-                d[b] = []
+            for fld in full[-self.tdat.numfieldsrepeating:]:
+                d[fld[0]] = []
         #
         for i in range(fentries):
+            fname, conv, func, lflag = full[i]
             try:
-                firstconv = self.S7023_F_Conversions[ftypes[i]](self, f[i])
-                if ffunc[i] is None:
-                    if flflag[i] == 0:
-                        d[fnames[i]] = firstconv
-                    else:
-                        d[fnames[i]].append(firstconv)
+                firstconv = conv(self, f[i])
+                if func is not None:
+                    firstconv = func(self, firstconv)
+                if lflag == 0:
+                    d[fname] = firstconv
                 else:
-                    if flflag[i] == 0:
-                        d[fnames[i]] = ffunc[i](self, firstconv)
-                    else:
-                        d[fnames[i]].append(ffunc[i](self, firstconv))
+                    d[fname].append(firstconv)
             except:
-                if flflag[i] == 0:
-                    d[fnames[i]] = self.TXT_UNKN_ERROR
+                if lflag == 0:
+                    d[fname] = self.TXT_UNKN_ERROR
                 else:
-                    d[fnames[i]].append(self.TXT_UNKN_ERROR)
+                    d[fname].append(self.TXT_UNKN_ERROR)
                 self.tdat.errors.adderror(self.tdat.errors.E_UNKNOWN,
                     self.tdat.errors.ELVL_MED, ptext +
-                    "Unknown Error extracting '" + str(fnames[i]) + "' field")
+                    "Unknown Error extracting '" + str(fname) + "' field")
         #
         self.tdat.tcontents = d
         if allerr:
@@ -4353,7 +4514,10 @@ class Tabledata(NPIF):
         """
         ptext = ("Packet " + str(self.hdr.packetnum) + "(" + self.hdr.tablename +
             ") - Invalid Enumeration, field: ")
-        for x, y in self.Find_Datatypes_in_Table('e'):
+        fields = self.Find_Datatypes_in_Table('e')
+        if not self._Fields_Contain_Text(fields, self.TXT_UNKN_ENUM):
+            return
+        for x, y in fields:
             if isinstance(y, list):
                 for i, b in enumerate(y):
                     if self.TXT_UNKN_ENUM in b:
@@ -4373,7 +4537,10 @@ class Tabledata(NPIF):
         """
         ptext = ("Packet " + str(self.hdr.packetnum) + "(" + self.hdr.tablename +
             ") - Invalid DTG value, field: ")
-        for x, y in self.Find_Datatypes_in_Table('d'):
+        fields = self.Find_Datatypes_in_Table('d')
+        if not self._Fields_Contain_Text(fields, self.TXT_BAD_DTG):
+            return
+        for x, y in fields:
             if isinstance(y, list):
                 for i, b in enumerate(y):
                     if self.TXT_BAD_DTG in b:
@@ -4393,7 +4560,10 @@ class Tabledata(NPIF):
         """
         ptext = ("Packet " + str(self.hdr.packetnum) + "(" + self.hdr.tablename
             + ") - Invalid ASCII, field: ")
-        for x, y in self.Find_Datatypes_in_Table('a'):
+        fields = self.Find_Datatypes_in_Table('a')
+        if not self._Fields_Contain_Text(fields, self.TXT_BAD_ASCII):
+            return
+        for x, y in fields:
             if isinstance(y, list):
                 for i, b in enumerate(y):
                     if self.TXT_BAD_ASCII in b:
@@ -4413,7 +4583,11 @@ class Tabledata(NPIF):
         """
         ptext = ("Packet " + str(self.hdr.packetnum) + "(" + self.hdr.tablename +
             ") - Out of Range Angle, field: ")
-        for x, y in self.Find_Datatypes_in_Table('r'):
+        rfields = self.Find_Datatypes_in_Table('r')
+        cfields = self.Find_Datatypes_in_Table('c')
+        if not self._Fields_Contain_Text(rfields + cfields, self.TXT_BAD_ANGLE):
+            return
+        for x, y in rfields:
             if isinstance(y, list):
                 for i, b in enumerate(y):
                     if self.TXT_BAD_ANGLE in str(b):
@@ -4426,7 +4600,7 @@ class Tabledata(NPIF):
                         self.tdat.errors.ELVL_LOW, ptext + str(x))
         #
         # need to repeat for 'c' data
-        for x, y in self.Find_Datatypes_in_Table('c'):
+        for x, y in cfields:
             if isinstance(y, list):
                 for i, b in enumerate(y):
                     if self.TXT_BAD_ANGLE in str(b[0]) or self.TXT_BAD_ANGLE in str(b[1]):
@@ -4448,51 +4622,50 @@ class Tabledata(NPIF):
             self.hdr.tablename + ") - Mandatory Field has NULL value, field: ")
         # in case not populated (e.g. user defined table)
         if self.tdat.fieldtypes is not None:
-            for i, t in enumerate(self.tdat.fieldtypes):
-                if self.tdat.fieldreqs[i] == 'm':
-                    # the list is range of types checked, excluding coords
-                    # (done below)
-                    if t in ['a', 'r', 'i', 'j', 'd']:
-                        n = self.tdat.fieldnames[i]
-                        xcont = self.tdat.tcontents[n]
-                        if isinstance(xcont, list):
-                            for j, b in enumerate(xcont):
-                                if self.TXT_NULL in str(b):
-                                    self.tdat.errors.adderror(
-                                        self.tdat.errors.E_MANDFIELD,
-                                        self.tdat.errors.ELVL_LOW, ptext +
-                                        str(n) + ", entry: " + str(j))
-                        else:
-                            if self.TXT_NULL in str(xcont):
+            if not self._Fields_Contain_Text(self.tdat.tcontents.items(),
+                    self.TXT_NULL):
+                return
+            # the types that can be checked are a, r, i, j, d and c. Others
+            # are not checked:
+            # h (only used twice, accross all tables - jpeg tables)
+            # e (any problems handled under enumeration checks)
+            # b (one use only in gen tgt info table)
+            # q (three uses only - dynam platform tables and jpeg huffman)
+            # x (9 uses, but mostly for payload data)
+            # z (no uses - backup type for errors)
+            for i, t in _mandatory_fields(tuple(self.tdat.fieldtypes),
+                    tuple(self.tdat.fieldreqs)):
+                n = self.tdat.fieldnames[i]
+                if t != 'c':
+                    xcont = self.tdat.tcontents[n]
+                    if isinstance(xcont, list):
+                        for j, b in enumerate(xcont):
+                            if self.TXT_NULL in str(b):
                                 self.tdat.errors.adderror(
                                     self.tdat.errors.E_MANDFIELD,
                                     self.tdat.errors.ELVL_LOW, ptext +
-                                    str(n))
-                    elif t == 'c':
-                        n = self.tdat.fieldnames[i]
-                        xcont = self.tdat.tcontents.get(n,(None,None))
-                        if isinstance(xcont, list):
-                            for j, b in enumerate(xcont):
-                                if self.TXT_NULL in str(b[0]) or self.TXT_NULL in str(b[1]):
-                                    self.tdat.errors.adderror(
-                                        self.tdat.errors.E_MANDFIELD,
-                                        self.tdat.errors.ELVL_LOW, ptext +
-                                        str(n) + ", entry: " + str(j))
-                        else:
-                            if self.TXT_NULL in str(xcont[0]) or self.TXT_NULL in str(xcont[1]):
+                                    str(n) + ", entry: " + str(j))
+                    else:
+                        if self.TXT_NULL in str(xcont):
+                            self.tdat.errors.adderror(
+                                self.tdat.errors.E_MANDFIELD,
+                                self.tdat.errors.ELVL_LOW, ptext +
+                                str(n))
+                else:
+                    xcont = self.tdat.tcontents.get(n,(None,None))
+                    if isinstance(xcont, list):
+                        for j, b in enumerate(xcont):
+                            if self.TXT_NULL in str(b[0]) or self.TXT_NULL in str(b[1]):
                                 self.tdat.errors.adderror(
                                     self.tdat.errors.E_MANDFIELD,
                                     self.tdat.errors.ELVL_LOW, ptext +
-                                    str(n))
+                                    str(n) + ", entry: " + str(j))
                     else:
-                        # not a type that can be checked
-                        # h (only used twice, accross all tables - jpeg tables)
-                        # e (any problems handled under enumeration checks)
-                        # b (one use only in gen tgt info table)
-                        # q (three uses only - dynam platform tables and jpeg huffman)
-                        # x (9 uses, but mostly for payload data)
-                        # z (no uses - backup type for errors)
-                        pass
+                        if self.TXT_NULL in str(xcont[0]) or self.TXT_NULL in str(xcont[1]):
+                            self.tdat.errors.adderror(
+                                self.tdat.errors.E_MANDFIELD,
+                                self.tdat.errors.ELVL_LOW, ptext +
+                                str(n))
         return
 
     def Check_DT_Cond_Fields(self):
@@ -4504,7 +4677,8 @@ class Tabledata(NPIF):
         ptext = ("Packet " + str(self.hdr.packetnum) + "(" + self.hdr.tablename +
             ") - ")
 
-        if self.hdr.tablecode == self.DT_Min_Dynamic_Plat_DT:
+        tc = self.hdr.tablecode
+        if tc == self.DT_Min_Dynamic_Plat_DT:
             # 3 'sets' of conditionals here
             # 1) at least one of fields 3,4 & 5 be populated
             # 2) at least one of 6 & 7 must be populated
@@ -4532,7 +4706,7 @@ class Tabledata(NPIF):
                     self.tdat.errors.ELVL_LOW, ptext +
                     "At Least one of 'Platform true Course' & 'Platform Yaw'" +
                     " must be populated")
-        elif self.hdr.tablecode == self.DT_Comp_Dynamic_Plat_DT:
+        elif tc == self.DT_Comp_Dynamic_Plat_DT:
             # 3 'sets' of conditionals here
             # 1) at least one of fields 3,4 & 5 be populated
             # 2) at least one of 6 & 7 must be populated
@@ -4560,7 +4734,7 @@ class Tabledata(NPIF):
                     self.tdat.errors.ELVL_LOW, ptext +
                     "At Least one of 'Platform true Course' & 'Platform Yaw' " +
                     "must be populated")
-        elif self.hdr.tablecode == self.DT_Event_Index_DT:
+        elif tc == self.DT_Event_Index_DT:
             # two related conditionals here (hope my interpretation is correct)
             # 1) if field 1 enumeration is 0 or 3 field 2 must be non NULL,
             #    otherwise field 2 must be NULL
@@ -4592,7 +4766,7 @@ class Tabledata(NPIF):
                         self.tdat.errors.ELVL_LOW, ptext +
                         "With Given Value of 'Event Type', 'Target " +
                         "Sub-section' must not be '0'")
-        elif self.hdr.tablecode == self.DT_RADAR_Sensor_Des_DT:
+        elif tc == self.DT_RADAR_Sensor_Des_DT:
             # 1) if field 7 is enumeration '8', field 12 must be enumeration '0'
             # 2) if field 7 has any other value, field 12 must not be enumeration '0'
             #
@@ -4608,7 +4782,7 @@ class Tabledata(NPIF):
                     self.tdat.errors.adderror(self.tdat.errors.E_CONDFIELD,
                         self.tdat.errors.ELVL_LOW, ptext +
                         "With Given Value of 'Coordinate System Orientation', 'vld orientation' must not be 'Unused'")
-        elif self.hdr.tablecode == self.DT_Reference_Track_DT:
+        elif tc == self.DT_Reference_Track_DT:
             # at least one of fields 2, 3 and 4 must be populated
             if (self.TXT_NULL in str(self.tdat.tcontents['Sensor Virtual Position MSL altitude']) and
                 self.TXT_NULL in str(self.tdat.tcontents['Sensor Virtual Position AGL altitude']) and
@@ -4617,7 +4791,7 @@ class Tabledata(NPIF):
                         self.tdat.errors.ELVL_LOW, ptext +
                         "At Least one of the three Altitude fields must be " +
                         "populated")
-        elif self.hdr.tablecode == self.DT_Rectified_ImGeo_DT:
+        elif tc == self.DT_Rectified_ImGeo_DT:
             # 1) if f29 (Projection type) is enum (1) then data 1 to data 6 should
             # be non null
             # 2) if f29 (Projection type) is enum (2) or enum (3) then data 1 to
@@ -4691,7 +4865,7 @@ class Tabledata(NPIF):
                             self.tdat.errors.ELVL_LOW, ptext +
                             "For given projection type, there should only be" +
                             " NULL values in fields 'Data 8' to 'Data 20'")
-        elif self.hdr.tablecode == self.DT_ISAR_Track_DT:
+        elif tc == self.DT_ISAR_Track_DT:
             # if field 3 is not NULL, then f4 must not be enumeration 0
             if self.TXT_NULL not in str(self.tdat.tcontents['Track ID']):
                 if self.tdat.tcontents['Track type'] == self.Lookup_Track_type(0):
@@ -5286,6 +5460,20 @@ class Tabledata(NPIF):
             self.hdr.errors.printerrors(obuf=obuf, strictcsv=strictcsv)
             self.tdat.errors.printerrors(obuf=obuf, strictcsv=strictcsv)
 
+    def _Fields_Contain_Text(self, fields, txt):
+        """
+        Quick test of whether txt appears anywhere in the values (or list
+        entries) of fields, an iterable of (name, value) tuples. Lets the
+        Check_DT_* methods skip their field by field checks on clean tables.
+        """
+        parts = []
+        for _, y in fields:
+            if isinstance(y, list):
+                parts.extend(map(str, y))
+            else:
+                parts.append(str(y))
+        return txt in '\x1f'.join(parts)
+
     def Find_Datatypes_in_Table(self, intype):
         """
         Returns list of tuples containing field name & value for table elements
@@ -5331,6 +5519,26 @@ class Tablelist (NPIF):
                                     # with that tablecode
         self.postamblestyle = None  # integer to indicate postable style: 0= none, 1= end of each segment, 2= attached to preamble
         self.sensoridlist = []      # list of unique sensor IDs in file
+        # lookup dicts built once by _build_indices when a file is opened
+        self._plat_ids_min = None       # set of Platform IDs with Minimum Dynamic Platform tables
+        self._plat_ids_comp = None      # set of Platform IDs with Comprehensive Dynamic Platform tables
+        self._sen_ids_minatt = None     # set of Sensor IDs with Minimum Sensor Attitude tables
+        self._sen_ids_compatt = None    # set of Sensor IDs with Comprehensive Sensor Attitude tables
+        self._gimbals_min = None        # Sensor ID -> set of Gimbal IDs with Minimum Gimbal Attitude tables
+        self._gimbals_comp = None       # Sensor ID -> set of Gimbal IDs with Comprehensive Gimbal Attitude tables
+        self._marker_by_seg_event = None  # (segment number, event number) -> list of (Event Marker table index,
+                                          # tuple of values compared against Event Index tables)
+        self._senid_tab_ids = None      # set of Sensor IDs with a Sensor ID table in the record
+        self._senid_tab_ids0 = None     # set of Sensor IDs with a Sensor ID table in the preamble
+        self._timetag_in_preamble = False  # True if a Format Time Tag table is in the preamble
+        self._sensor_refs = None        # set of sensor numbers referred to in table fields
+        # table field names (tcontents keys) used by the file checks
+        self._key_sensor_comp = self.S7023_FLD_NAMES[self.DT_Sensor_Compression_DT][0]  # compression algorithm
+        self._key_event_marker = self.S7023_FLD_NAMES[self.DT_Event_Marker_DT][0]  # event number
+        self._key_segidx_start = self.S7023_FLD_NAMES[self.DT_Segment_Index_DT][0]  # start offset
+        self._key_segidx_end = self.S7023_FLD_NAMES[self.DT_Segment_Index_DT][1]  # end offset
+        self._key_segidx_starttt = self.S7023_FLD_NAMES[self.DT_Segment_Index_DT][4]  # start timetag
+        self._key_segidx_endtt = self.S7023_FLD_NAMES[self.DT_Segment_Index_DT][5]  # end timetag
 
     def Check_Is_7023_File(self, fname):
         """
@@ -5377,10 +5585,8 @@ class Tablelist (NPIF):
 
         self.filename = os.path.abspath(fname)
         self.filesize = os.stat(fname).st_size
-        mp = open(fname, 'rb')
-        mstr = mp.read()
-        mp.close()
-        fdata = mstr
+        with open(fname, 'rb') as mp:
+            fdata = mp.read()
         ldata = fdata.split(self.SYNC_FIELD)
         # get position of 1st sync code
         nextstart = fdata.find(self.SYNC_FIELD)
@@ -5396,21 +5602,19 @@ class Tablelist (NPIF):
         # the start
         ldata = ldata[1:]
         count = 0
-        seglist = []
+        seglist = set()
         for a in ldata:
             b = Tabledata()
             b.extract_header(a, count)
             b.extract_data(b.tdat.dataraw, allerr=allerr)
             self.packetstarts.append(nextstart)
             nextstart += b.hdr.totlen
-            if b.hdr.segmentnum not in seglist:
-                seglist.append(b.hdr.segmentnum)
+            seglist.add(b.hdr.segmentnum)
             self.packets.append(b)
             count += 1
         self.numpackets = count
         # sort segment list, just in case of odd (i.e. broken) file
-        seglist.sort()
-        self.segmentlist = seglist
+        self.segmentlist = sorted(seglist)
         # 
         # Create packetdict info. This is a dict with keys of tablecode (i.e. what data table is 
         # present) and values which are lists of those packets in the file with that tablecode.
@@ -5433,12 +5637,109 @@ class Tablelist (NPIF):
                 segl.append(self.packets[p].hdr.segmentnum)
         self.dataseglist = segl
         #
-        # generate list of used sensor IDs in file
+        # generate list of used sensor IDs in file and build lookup dicts
+        # shared by the file checks
+        self._build_indices()
+
+    def _build_indices(self):
+        """
+        Walk the packets once, building the list of sensor IDs in use and
+        everything the file checks need from individual packets: tables
+        grouped by platform ID, sensor ID or (segment, event number), and the
+        sensor numbers referred to in table fields.
+        """
         senlist = []
+        senseen = set()
+        senidtabs = set()
+        senidtabs0 = set()
+        ttpreamble = False
+        refs = set()
+        platmin = set()
+        platcomp = set()
+        senmin = set()
+        sencomp = set()
+        gimbmin = collections.defaultdict(set)
+        gimbcomp = collections.defaultdict(set)
+        markers = collections.defaultdict(list)
+        mkey = self._key_event_marker
+        # event marker values checked against event index tables: event type,
+        # target number, primary, secondary and tertiary sensor numbers
+        mfn = self.S7023_FLD_NAMES[self.DT_Event_Marker_DT]
+        getmvals = operator.itemgetter(mfn[1], mfn[5], mfn[2], mfn[3], mfn[4])
+        offset = self.frontbytelen
+        grpkey = self.S7023_FLD_NAMES[self.DT_Sensor_Grouping_DT][4]
+        mrkkeys = self.S7023_FLD_NAMES[self.DT_Event_Marker_DT][2:5]
+        indkeys = self.S7023_FLD_NAMES[self.DT_Event_Index_DT][6:9]
+        virkeys = self.S7023_FLD_NAMES[self.DT_Virtual_Sensor_Def_DT][2:6]
+        notinuse = self.TXT_NOTINUSE
+        # table codes bound locally for the per-packet dispatch below
+        dtmark = self.DT_Event_Marker_DT
+        dtindex = self.DT_Event_Index_DT
+        dtgroup = self.DT_Sensor_Grouping_DT
+        dtvirt = self.DT_Virtual_Sensor_Def_DT
+        dtsenid = self.DT_Sensor_ID_DT
+        dttime = self.DT_Format_Time_Tag_DT
+        dtplatmin = self.DT_Min_Dynamic_Plat_DT
+        dtplatcomp = self.DT_Comp_Dynamic_Plat_DT
+        dtsenmin = self.DT_Min_Sensor_Att_DT
+        dtsencomp = self.DT_Comp_Sensor_Att_DT
+        dtgimbmin = self.DT_Min_Gimbals_Att_DT
+        dtgimbcomp = self.DT_Comp_Gimbals_Att_DT
         for p in self.packets:
-            if p.hdr.Sensor_ID_Num != None:
-                if p.hdr.Sensor_ID_Num not in senlist:
-                    senlist.append(p.hdr.Sensor_ID_Num)
+            h = p.hdr
+            sid = h.Sensor_ID_Num
+            if sid is not None and sid not in senseen:
+                senseen.add(sid)
+                senlist.append(sid)
+            tc = h.tablecode
+            cont = p.tdat.tcontents
+            if tc == dtmark:
+                if cont is not None:
+                    pnum = h.packetnum
+                    mvals = getmvals(cont) + (h.timetag,
+                        self.packetstarts[pnum] - offset)
+                    markers[(h.segmentnum, cont[mkey])].append((pnum, mvals))
+                    refs.update(cont[k] for k in mrkkeys)
+            elif tc == dtindex:
+                if cont is not None:
+                    refs.update(cont[k] for k in indkeys)
+            elif tc == dtgroup:
+                if cont is not None:
+                    refs.update(cont[grpkey])
+            elif tc == dtvirt:
+                if cont is not None:
+                    refs.update(cont[k] for k in virkeys if cont[k] != notinuse)
+            elif tc == dtsenid:
+                senidtabs.add(sid)
+                if h.segmentnum == 0:
+                    senidtabs0.add(sid)
+            elif tc == dttime:
+                if h.segmentnum == 0 and h.ambleflag == 1:
+                    ttpreamble = True
+            elif tc == dtplatmin:
+                platmin.add(h.Platform_ID_Num)
+            elif tc == dtplatcomp:
+                platcomp.add(h.Platform_ID_Num)
+            elif tc == dtsenmin:
+                senmin.add(h.Sensor_ID_Num)
+            elif tc == dtsencomp:
+                sencomp.add(h.Sensor_ID_Num)
+            elif tc == dtgimbmin:
+                gimbmin[h.Sensor_ID_Num].add(h.Gimbal_ID_Num)
+            elif tc == dtgimbcomp:
+                gimbcomp[h.Sensor_ID_Num].add(h.Gimbal_ID_Num)
+        self._plat_ids_min = platmin
+        self._plat_ids_comp = platcomp
+        self._sen_ids_minatt = senmin
+        self._sen_ids_compatt = sencomp
+        # plain dicts from here on, so reads cannot add empty entries
+        self._gimbals_min = dict(gimbmin)
+        self._gimbals_comp = dict(gimbcomp)
+        self._marker_by_seg_event = dict(markers)
+        self._senid_tab_ids = senidtabs
+        self._senid_tab_ids0 = senidtabs0
+        self._timetag_in_preamble = ttpreamble
+        self._sensor_refs = refs
         self.sensoridlist = senlist
 
     def Print_All_Tables(self, obuf=sys.stdout, detail=False, strictcsv=False, errors=False):
@@ -5832,7 +6133,7 @@ class Tablelist (NPIF):
         # from them
         sensornums = []
         comptypes = []
-        keyname = self.S7023_FLD_NAMES[self.DT_Sensor_Compression_DT][0]
+        keyname = self._key_sensor_comp
         #
         sclist = self.packetdict[self.DT_Sensor_Compression_DT]
         sdlist = self.packetdict[self.DT_Sensor_DT]
@@ -5858,6 +6159,9 @@ class Tablelist (NPIF):
         """
         Checks that data file numbering behaves as expected.
         """
+        adderror = self.errors.adderror
+        etype = self.errors.E_DFNUM
+        elow = self.errors.ELVL_LOW
         # within each segment numbering should start at zero and for each source
         # address should incrementally increase.
         # numbers can be out of order, as they represent generation rather than
@@ -5889,13 +6193,11 @@ class Tablelist (NPIF):
                 ll.sort()
                 dl, pl = zip(*ll)
                 # check stuff
-                etxt = ("Segment " + str(s) + ", Source Address " + str(sa) +
-                    ", ")
+                etxt = f"Segment {s}, Source Address {sa}, "
                 # check 1st one is zero
                 if dl[0] != 0:
-                    self.errors.adderror(self.errors.E_DFNUM,
-                        self.errors.ELVL_LOW, etxt + "Data File "
-                        "numbers begin at " + str(dl[0]) + " rather than 0")
+                    adderror(etype, elow, f"{etxt}Data File numbers begin at "
+                        f"{dl[0]} rather than 0")
                 # check they increase with jumps of no more than 1
                 cur = dl[0]
                 for i, n in enumerate(dl):
@@ -5907,10 +6209,9 @@ class Tablelist (NPIF):
                         dllen = len(dl)
                         ihigh = min(dllen, i + 8)
                         eseq = dl[ilow:ihigh]
-                        self.errors.adderror(self.errors.E_DFNUM,
-                            self.errors.ELVL_LOW, etxt + "Data File "
-                            "number sequence has gaps e.g. subset of " +
-                            str(dllen) + " elements= " + str(eseq))
+                        adderror(etype, elow, f"{etxt}Data File number "
+                            f"sequence has gaps e.g. subset of {dllen} "
+                            f"elements= {eseq}")
                         break
                 # now seek for files with identical DFNs but non identical
                 # packets
@@ -5936,13 +6237,10 @@ class Tablelist (NPIF):
                             checkcount = 1
                         #
                         if checkcount:
-                            self.errors.adderror(self.errors.E_DFNUM,
-                                self.errors.ELVL_LOW, etxt + "Packet " +
-                                str(p) + "(" + str(p2.hdr.tablename) +
-                                ") has same data file number (" + str(d) +
-                                ") as packet " + str(lpac) + "(" +
-                                str(p1.hdr.tablename) +
-                                "), but is not identical")
+                            adderror(etype, elow, f"{etxt}Packet {p}"
+                                f"({p2.hdr.tablename}) has same data file "
+                                f"number ({d}) as packet {lpac}"
+                                f"({p1.hdr.tablename}), but is not identical")
                     else:
                         ldfn = d
                         lpac = p
@@ -5955,6 +6253,10 @@ class Tablelist (NPIF):
         through the preamble, and for presence of tables not allowed in a
         preamble.
         """
+        adderror = self.errors.adderror
+        etype = self.errors.E_SEG0AMBLE
+        elow = self.errors.ELVL_LOW
+        ewarn = self.errors.ELVL_WARN
         # get list of segment 0 packets
         seg0 = []
         for p in self.packets:
@@ -5964,46 +6266,34 @@ class Tablelist (NPIF):
         for p in seg0:
             if p.hdr.tablecode == self.DT_End_Segment_Marker_DT:
                 if p.hdr.ambleflag == 1:
-                    self.errors.adderror(self.errors.E_SEG0AMBLE,
-                        self.errors.ELVL_LOW, "Packet " +
-                        str(p.hdr.packetnum) + "(" + str(p.hdr.tablename) +
-                        ") End of Segment Tables should not be part of the " +
-                        "Preamble")
+                    adderror(etype, elow, f"Packet {p.hdr.packetnum}"
+                        f"({p.hdr.tablename}) End of Segment Tables should "
+                        "not be part of the Preamble")
             elif p.hdr.ambleflag != 1:
-                self.errors.adderror(self.errors.E_SEG0AMBLE,
-                    self.errors.ELVL_LOW, "Packet " +
-                    str(p.hdr.packetnum) + "(" + str(p.hdr.tablename) +
-                    ") is in segment 0, but is not flagged as " +
-                    "pre/postamble")
+                adderror(etype, elow, f"Packet {p.hdr.packetnum}"
+                    f"({p.hdr.tablename}) is in segment 0, but is not "
+                    "flagged as pre/postamble")
         # check there are no repeats of preamble data tables
-        rptlist = []
-        rptdict = {}
-        for p in seg0:
-            newl = (p.hdr.sourceaddress, p.hdr.datafileaddress)
-            if newl not in rptlist:
-                rptlist.append(newl)
-            else:
-                if newl in rptdict:
-                    rptdict[newl][1] += 1
-                else:
-                    rptdict[newl] = [p.hdr.tablename, 1]
-        for a in rptdict:
+        pairs = [(p.hdr.sourceaddress, p.hdr.datafileaddress) for p in seg0]
+        names = {}
+        for a, p in zip(pairs, seg0):
+            names.setdefault(a, p.hdr.tablename)
+        rptcount = collections.Counter(pairs)
+        for a, c in rptcount.items():
+            if c < 2:
+                continue
             s, d = a
-            n = rptdict[a][0]
-            c = rptdict[a][1]
-            self.errors.adderror(self.errors.E_SEG0AMBLE,
-                self.errors.ELVL_WARN, str(n) + "(SA=" + str(s) + " DFA=" +
-                str(d) + ") packets are repeated " + str(c) + " times in " +
-                "preamble. Check carefully as this is likely to be error.")
+            n = names[a]
+            adderror(etype, ewarn, f"{n}(SA={s} DFA={d}) packets are "
+                f"repeated {c - 1} times in preamble. Check carefully as "
+                "this is likely to be error.")
         # check that are no sensor data packets in preamble.
         for p in seg0:
             if p.hdr.sourcecode == self.SA_Platform_Data:
                 # this should not be in preamble
-                etxt = ("Packet " + str(p.hdr.packetnum) + " (" +
-                    str(p.hdr.tablename) + ") is sensor data and should not " +
-                    "be in Segment 0")
-                self.errors.adderror(self.errors.E_SEG0AMBLE,
-                    self.errors.ELVL_LOW, etxt)
+                etxt = (f"Packet {p.hdr.packetnum} ({p.hdr.tablename}) is "
+                    "sensor data and should not be in Segment 0")
+                adderror(etype, elow, etxt)
         return
 
     def identifypostamblestyle(self):
@@ -6034,26 +6324,25 @@ class Tablelist (NPIF):
             else:
                 # we have postambles outside segment 0 with no index tables
                 self.errors.adderror(self.errors.E_INDEXAMBLE,
-                    self.errors.ELVL_LOW, "Postambles " +
-                    " do not contain any index tables")
+                    self.errors.ELVL_LOW,
+                    "Postambles  do not contain any index tables")
                 self.postamblestyle = 1
-        allindex = indseg + indsen + indeve
         # check if all index files in segment 0
         seglist = []
         noflag = []
-        for p in allindex:
-            if self.packets[p].hdr.ambleflag == 1:
-                seglist.append(self.packets[p].hdr.segmentnum)
+        for p in itertools.chain(indseg, indsen, indeve):
+            h = self.packets[p].hdr
+            if h.ambleflag == 1:
+                seglist.append(h.segmentnum)
             else:
-                noflag.append(self.packets[p].hdr.segmentnum)
+                noflag.append(h.segmentnum)
         #
         if len(noflag) != 0:
             # warn of presence of index tables with no flag set
             # as it might be valid...
             self.errors.adderror(self.errors.E_INDEXAMBLE,
-                self.errors.ELVL_LOW, "Packets " +
-                str(noflag) + " are index tables which do not have a " +
-                "postamble flag set")
+                self.errors.ELVL_LOW, f"Packets {noflag} are index tables "
+                "which do not have a postamble flag set")
         if set(seglist) == set([0]) and len(postsegs) == 0 :
             # all index tables are in segment 0, and nothing flagged as
             # amble outside segment 0
@@ -6064,9 +6353,9 @@ class Tablelist (NPIF):
             # raise error and assume style 1
             self.postamblestyle = 1
             self.errors.adderror(self.errors.E_INDEXAMBLE,
-                self.errors.ELVL_LOW, "Index tables present in Segment 0 " +
+                self.errors.ELVL_LOW, "Index tables present in Segment 0 "
                 ", implying a single postamble in Segment 0. However postamble"
-                + "flagged packets are present in other Segments, implying" +
+                "flagged packets are present in other Segments, implying"
                 " Postambles at end of each data Segment (assuming latter)")
         else:
             self.postamblestyle = 1
@@ -6075,7 +6364,7 @@ class Tablelist (NPIF):
         # segment 0
         if self.postamblestyle == 2:
             allindexa = []
-            for p in allindex:
+            for p in itertools.chain(indseg, indsen, indeve):
                 if self.packets[p].hdr.ambleflag == 1:
                     allindexa.append(p)
             seg0index = allindexa
@@ -6089,8 +6378,8 @@ class Tablelist (NPIF):
             delta = list(set(forcast) - set(seg0index))
             if len(delta) != 0:
                 # then there are intervening packets which are non index
-                etxt = ("Index tables were not all at end of Segment 0, " +
-                    "intervening tables were:" + str(delta))
+                etxt = ("Index tables were not all at end of Segment 0, "
+                    f"intervening tables were:{delta}")
                 self.errors.adderror(self.errors.E_INDEXAMBLE,
                     self.errors.ELVL_LOW, etxt)
         return
@@ -6116,10 +6405,9 @@ class Tablelist (NPIF):
                     plist.append(p)
             if len(plist) != 0:
                 self.errors.adderror(self.errors.E_POSTAMBLE,
-                    self.errors.ELVL_LOW, "Packets " +
-                    str(plist) + " do not appear to be in valid " +
-                    "postambles (i.e. valid postambles should have index " +
-                    "tables), but are flagged as postamble")
+                    self.errors.ELVL_LOW, f"Packets {plist} do not appear to "
+                    "be in valid postambles (i.e. valid postambles should "
+                    "have index tables), but are flagged as postamble")
         if self.postamblestyle == 1:
             # check continuous sequence of amble flagged packets before each
             # end of segment marker
@@ -6141,10 +6429,9 @@ class Tablelist (NPIF):
                 if len(delta) != 0:
                     # then there are intevening packets not flagged as postamble
                     self.errors.adderror(self.errors.E_POSTAMBLE,
-                        self.errors.ELVL_LOW, "Segment " + str(seg) +
-                        " postamble runs from packet " + str(minp) +
-                        " to packet " + str(maxp) + " but intervening packets ("
-                        + str(delta) + ") are not flagged as postamble")
+                        self.errors.ELVL_LOW, f"Segment {seg} postamble runs "
+                        f"from packet {minp} to packet {maxp} but intervening "
+                        f"packets ({delta}) are not flagged as postamble")
         return
 
     def check_postambletables1(self):
@@ -6154,6 +6441,9 @@ class Tablelist (NPIF):
         preamble table.
         This does not check the correct index tables are present.
         """
+        adderror = self.errors.adderror
+        etype = self.errors.E_POSTAMBLE
+        elow = self.errors.ELVL_LOW
         if self.postamblestyle == 0 or self.postamblestyle == 2:
             # no need to do any of these checks
             return
@@ -6188,11 +6478,9 @@ class Tablelist (NPIF):
                     if same == 0:
                         # it is non index and not same as anything in preamble
                         # report error
-                        self.errors.adderror(self.errors.E_POSTAMBLE,
-                            self.errors.ELVL_LOW, "Postamble for Segment " +
-                            str(skeys) + " contains packet (num= " + str(p) +
-                            ", " + str(pp.hdr.tablename) + ") which is " +
-                            "neither an index table nor a repeat of a " +
+                        adderror(etype, elow, f"Postamble for Segment {skeys} "
+                            f"contains packet (num= {p}, {pp.hdr.tablename}) "
+                            "which is neither an index table nor a repeat of a "
                             "preamble table")
         return
 
@@ -6201,6 +6489,9 @@ class Tablelist (NPIF):
         Check that the correct combination of segment index files exist in each
         postamble.
         """
+        adderror = self.errors.adderror
+        etype = self.errors.E_POSTAMBLE
+        elow = self.errors.ELVL_LOW
         if self.postamblestyle == 0:
             # nothing to do here
             return
@@ -6209,10 +6500,9 @@ class Tablelist (NPIF):
         indseg = self.packetdict[self.DT_Segment_Index_DT]
         pamble = collections.defaultdict(list)
         for pp in indseg:
-            p = self.packets[pp]
-            if p.hdr.ambleflag == 1:
-                s = p.hdr.segmentnum
-                pamble[s].append(p.hdr.Segment_ID_Num)
+            h = self.packets[pp].hdr
+            if h.ambleflag == 1:
+                pamble[h.segmentnum].append(h.Segment_ID_Num)
         # pamble now contains segment keys listing all segment ID numbers of
         # segment index amble packets
         #
@@ -6231,23 +6521,20 @@ class Tablelist (NPIF):
                 if s in loclist:
                     loclist.remove(s)
                 else:
-                    etxt = ("Missing segment " + str(s) + " index table" +
-                    " within Postamble for Segment " + str(keys))
-                    self.errors.adderror(self.errors.E_POSTAMBLE,
-                        self.errors.ELVL_LOW, etxt)
+                    etxt = (f"Missing segment {s} index table within "
+                        f"Postamble for Segment {keys}")
+                    adderror(etype, elow, etxt)
             # check if loclist is now empty
             for s in loclist:
                 # then either duplicate index tables or tables for non existent
                 # segments
                 if s in fcast[keys]:
-                    etxt = ("Multiple segment " + str(s) + " index tables " +
-                    "within Postamble for Segment " + str(keys))
+                    etxt = (f"Multiple segment {s} index tables within "
+                        f"Postamble for Segment {keys}")
                 else:
-                    etxt = ("Postamble for Segment " + str(keys) +
-                        " includes egment index table for (non existent) " +
-                        "segment, " + str(s))
-                self.errors.adderror(self.errors.E_POSTAMBLE,
-                    self.errors.ELVL_LOW, etxt)
+                    etxt = (f"Postamble for Segment {keys} includes egment "
+                        f"index table for (non existent) segment, {s}")
+                adderror(etype, elow, etxt)
         return
 
     def check_postsenindex(self):
@@ -6255,6 +6542,9 @@ class Tablelist (NPIF):
         Check that the correct combination of sensor index files exist in each
         postamble.
         """
+        adderror = self.errors.adderror
+        etype = self.errors.E_POSTAMBLE
+        elow = self.errors.ELVL_LOW
         if self.postamblestyle == 0:
             # nothing to do here
             return
@@ -6263,11 +6553,9 @@ class Tablelist (NPIF):
         indsen = self.packetdict[self.DT_Sensor_Index_DT]
         pamble = collections.defaultdict(list)
         for pp in indsen:
-            p = self.packets[pp]
-            if p.hdr.ambleflag == 1:
-                s = p.hdr.segmentnum
-                e = (p.hdr.Segment_ID_Num, p.hdr.Sensor_ID_Num)
-                pamble[s].append(e)
+            h = self.packets[pp].hdr
+            if h.ambleflag == 1:
+                pamble[h.segmentnum].append((h.Segment_ID_Num, h.Sensor_ID_Num))
         # pamble now contains segment keys listing all segment ID numbers and
         # sensor numbers of segment index amble packets
         #
@@ -6297,27 +6585,22 @@ class Tablelist (NPIF):
                 if s in loclist:
                     loclist.remove(s)
                 else:
-                    etxt = ("Missing sensor index table (for seg=" + str(seg) +
-                    " sen=" + str(sen) + ") within Postamble for Segment "
-                    + str(keys))
-                    self.errors.adderror(self.errors.E_POSTAMBLE,
-                        self.errors.ELVL_LOW, etxt)
+                    etxt = (f"Missing sensor index table (for seg={seg} "
+                        f"sen={sen}) within Postamble for Segment {keys}")
+                    adderror(etype, elow, etxt)
             # check if loclist is now empty
             for s in loclist:
                 # then either duplicate index tables or tables for non existent
                 # segments/sensor combos
                 seg, sen = s
                 if s in fcast[keys]:
-                    etxt = ("Multiple sensor index tables (for seg=" + str(seg)
-                    + " sen=" + str(sen) + ") within Postamble for Segment "
-                    + str(keys))
+                    etxt = (f"Multiple sensor index tables (for seg={seg} "
+                        f"sen={sen}) within Postamble for Segment {keys}")
                 else:
-                    etxt = ("Postamble for Segment " + str(keys) +
-                        " includes sensor index table for (non existent) " +
-                        "segment-sensor combination (seg=" + str(seg) +
-                        " sen=" + str(sen) + ")")
-                self.errors.adderror(self.errors.E_POSTAMBLE,
-                    self.errors.ELVL_LOW, etxt)
+                    etxt = (f"Postamble for Segment {keys} includes sensor "
+                        "index table for (non existent) segment-sensor "
+                        f"combination (seg={seg} sen={sen})")
+                adderror(etype, elow, etxt)
         return
 
     def check_posteventindex(self):
@@ -6325,6 +6608,9 @@ class Tablelist (NPIF):
         Check that the correct combination of event index files exist in each
         postamble.
         """
+        adderror = self.errors.adderror
+        etype = self.errors.E_POSTAMBLE
+        elow = self.errors.ELVL_LOW
         if self.postamblestyle == 0:
             # nothing to do here
             return
@@ -6332,17 +6618,15 @@ class Tablelist (NPIF):
         indeve = self.packetdict[self.DT_Event_Index_DT]
         pamble = collections.defaultdict(list)
         for pp in indeve:
-            p = self.packets[pp]
-            if p.hdr.ambleflag == 1:
-                s = p.hdr.segmentnum
-                e = (p.hdr.Segment_ID_Num, p.hdr.Event_ID_Num)
-                pamble[s].append(e)
+            h = self.packets[pp].hdr
+            if h.ambleflag == 1:
+                pamble[h.segmentnum].append((h.Segment_ID_Num, h.Event_ID_Num))
         # pamble now contains segment keys listing all segment ID numbers and
         # event numbers of event index amble packets
         #
         # work out what events are in data
         eventps = self.packetdict[self.DT_Event_Marker_DT]
-        key = self.S7023_FLD_NAMES[self.DT_Event_Marker_DT][0]
+        key = self._key_event_marker
         elist = []
         for p in eventps:
             s = self.packets[p].hdr.segmentnum
@@ -6366,40 +6650,33 @@ class Tablelist (NPIF):
                 if s in loclist:
                     loclist.remove(s)
                 else:
-                    etxt = ("Missing event index table (for seg=" + str(seg) +
-                    " event=" + str(eve) + ") within Postamble for Segment "
-                    + str(keys))
-                    self.errors.adderror(self.errors.E_POSTAMBLE,
-                        self.errors.ELVL_LOW, etxt)
+                    etxt = (f"Missing event index table (for seg={seg} "
+                        f"event={eve}) within Postamble for Segment {keys}")
+                    adderror(etype, elow, etxt)
             # check if loclist is now empty
             for s in loclist:
                 # then either duplicate index tables or tables for non existent
                 # segments/sensor combos
                 seg, eve = s
                 if s in fcast[keys]:
-                    etxt = ("Multiple event index tables (for seg=" + str(seg)
-                    + " event=" + str(eve) + ") within Postamble for Segment "
-                    + str(keys))
+                    etxt = (f"Multiple event index tables (for seg={seg} "
+                        f"event={eve}) within Postamble for Segment {keys}")
                 else:
-                    etxt = ("Postamble for Segment " + str(keys) +
-                        " includes event index table for (non existent) " +
-                        "segment-event combination (seg=" + str(seg) +
-                        " event=" + str(eve) + ")")
-                self.errors.adderror(self.errors.E_POSTAMBLE,
-                    self.errors.ELVL_LOW, etxt)
+                    etxt = (f"Postamble for Segment {keys} includes event "
+                        "index table for (non existent) segment-event "
+                        f"combination (seg={seg} event={eve})")
+                adderror(etype, elow, etxt)
         return
 
     def check_fileeditions(self):
         """
         Checks that a consistent Edition number is used through the file.
         """
-        edarray = []
-        for p in self.packets:
-            if p.hdr.edition not in edarray:
-                edarray.append(p.hdr.edition)
-        if len(edarray) > 1:
+        # editions in the order they are first seen in the file
+        edlist = list(dict.fromkeys(p.hdr.edition for p in self.packets))
+        if len(edlist) > 1:
             # give warning
-            etxt = "Mix of claimed Edition numbers in file: " + str(edarray)
+            etxt = "Mix of claimed Edition numbers in file: " + str(edlist)
             self.errors.adderror(self.errors.E_EDITION,
                 self.errors.ELVL_WARN, etxt)
 
@@ -6407,16 +6684,18 @@ class Tablelist (NPIF):
         """
         Check the contents of any segment index tables as far as possible.
         """
+        adderror = self.errors.adderror
+        etype = self.errors.E_SEGINDEX
+        elow = self.errors.ELVL_LOW
         segindextabs = self.packetdict[self.DT_Segment_Index_DT]
-        key1 = self.S7023_FLD_NAMES[self.DT_Segment_Index_DT][0]
-        key2 = self.S7023_FLD_NAMES[self.DT_Segment_Index_DT][1]
-        key5 = self.S7023_FLD_NAMES[self.DT_Segment_Index_DT][4]
-        key6 = self.S7023_FLD_NAMES[self.DT_Segment_Index_DT][5]
+        key1 = self._key_segidx_start
+        key2 = self._key_segidx_end
+        key5 = self._key_segidx_starttt
+        key6 = self._key_segidx_endtt
 
         for si in segindextabs:
             pp = self.packets[si]
-            ptext = ("Packet " + str(pp.hdr.packetnum) + "(" +
-                pp.hdr.tablename + ") - ")
+            ptext = f"Packet {pp.hdr.packetnum}({pp.hdr.tablename}) - "
             # read in table values from segment index table
             val1 = pp.tdat.tcontents[key1] # start offset
             val2 = pp.tdat.tcontents[key2] # end offset
@@ -6433,17 +6712,14 @@ class Tablelist (NPIF):
             # compare extracted values with declared values in segment index table
             if startoff != val1:
                 # declared value does not match file content for start offset
-                etxt = ("Field 1, Start of data segment value (" + str(val1)
-                    + ") does not match calculated value (" + str(startoff) +
-                    ")")
-                self.errors.adderror(self.errors.E_SEGINDEX,
-                    self.errors.ELVL_LOW, ptext + etxt)
+                etxt = (f"Field 1, Start of data segment value ({val1}) does "
+                    f"not match calculated value ({startoff})")
+                adderror(etype, elow, ptext + etxt)
             if tt != val5:
                 # declared value does not match file content for start timetag
-                etxt = ("Field 5, Start Header Time Tag (" + str(val5)
-                    + ") does not match calculated value (" + str(tt) + ")")
-                self.errors.adderror(self.errors.E_SEGINDEX,
-                    self.errors.ELVL_LOW, ptext + etxt)
+                etxt = (f"Field 5, Start Header Time Tag ({val5}) does not "
+                    f"match calculated value ({tt})")
+                adderror(etype, elow, ptext + etxt)
             # find last header in seg
             for p in reversed(self.packets):
                 # need to ignore postable and End of Segment tables in this calculation
@@ -6456,17 +6732,14 @@ class Tablelist (NPIF):
             endoff = self.packetstarts[last] - self.frontbytelen + plen
             if endoff != val2:
                 # declared value does not match file content for end offset
-                etxt = ("Field 2, End of data segment value (" + str(val2)
-                    + ") does not match calculated value (" + str(endoff) +
-                    ")")
-                self.errors.adderror(self.errors.E_SEGINDEX,
-                    self.errors.ELVL_LOW, ptext + etxt)
+                etxt = (f"Field 2, End of data segment value ({val2}) does "
+                    f"not match calculated value ({endoff})")
+                adderror(etype, elow, ptext + etxt)
             if tt != val6:
                 # declared value does not match file content for end timetag
-                etxt = ("Field 6, End Header Time Tag (" + str(val6)
-                    + ") does not match calculated value (" + str(tt) + ")")
-                self.errors.adderror(self.errors.E_SEGINDEX,
-                    self.errors.ELVL_LOW, ptext + etxt)
+                etxt = (f"Field 6, End Header Time Tag ({val6}) does not "
+                    f"match calculated value ({tt})")
+                adderror(etype, elow, ptext + etxt)
             # unsure how to calculate any other values for comparison
         return
 
@@ -6474,96 +6747,75 @@ class Tablelist (NPIF):
         """
         Check the contents of any event index tables as far as possible.
         """
+        adderror = self.errors.adderror
+        etype = self.errors.E_EVENTINDEX
+        elow = self.errors.ELVL_LOW
         # get indices of relevant tables
         eveindextabs = self.packetdict[self.DT_Event_Index_DT]
-        emarkertabs = self.packetdict[self.DT_Event_Marker_DT]
-        # get relevant keys for index
-        key1 = self.S7023_FLD_NAMES[self.DT_Event_Index_DT][0] # event type
-        key2 = self.S7023_FLD_NAMES[self.DT_Event_Index_DT][1] # target number
-        key4 = self.S7023_FLD_NAMES[self.DT_Event_Index_DT][3] # timetag
-        key7 = self.S7023_FLD_NAMES[self.DT_Event_Index_DT][6] # primary sensor number
-        key8 = self.S7023_FLD_NAMES[self.DT_Event_Index_DT][7] # secondary sensor number
-        key9 = self.S7023_FLD_NAMES[self.DT_Event_Index_DT][8] # tertiary sensor number
-        key10 = self.S7023_FLD_NAMES[self.DT_Event_Index_DT][9] # event file offset
-        # get keys for marker
-        mkey1 = self.S7023_FLD_NAMES[self.DT_Event_Marker_DT][0] # event number
-        mkey2 = self.S7023_FLD_NAMES[self.DT_Event_Marker_DT][1] # event type
-        mkey3 = self.S7023_FLD_NAMES[self.DT_Event_Marker_DT][2] # primary sensor number
-        mkey4 = self.S7023_FLD_NAMES[self.DT_Event_Marker_DT][3] # secondary sensor number
-        mkey5 = self.S7023_FLD_NAMES[self.DT_Event_Marker_DT][4] # tertiary sensor number
-        mkey6 = self.S7023_FLD_NAMES[self.DT_Event_Marker_DT][5] # target number
+        # index table values in the same order as the marker values held in
+        # _marker_by_seg_event: event type, target number, primary, secondary
+        # and tertiary sensor numbers, timetag, event file offset
+        ifn = self.S7023_FLD_NAMES[self.DT_Event_Index_DT]
+        getivals = operator.itemgetter(ifn[0], ifn[1], ifn[6], ifn[7], ifn[8],
+            ifn[3], ifn[9])
         #
-        # for each event index table extract info and run through event markers to find matching info
+        # event markers indexed by (segment number, event number) so each
+        # event index table can go straight to its matching marker(s)
+        packets = self.packets
+        markers = self._marker_by_seg_event
+        #
+        # for each event index table extract info and look up the matching event marker
         # report any discrepencies
         for si in eveindextabs:
-            pp = self.packets[si]
-            ptext = ("Packet " + str(pp.hdr.packetnum) + "(" +
-                pp.hdr.tablename + ") - ")
-            # read in index table values
-            val1 = pp.tdat.tcontents[key1]
-            val2 = pp.tdat.tcontents[key2]
-            val4 = pp.tdat.tcontents[key4]
-            val7 = pp.tdat.tcontents[key7]
-            val8 = pp.tdat.tcontents[key8]
-            val9 = pp.tdat.tcontents[key9]
-            val10 = pp.tdat.tcontents[key10]
-            sn = pp.hdr.Segment_ID_Num
-            en = pp.hdr.Event_ID_Num
+            pp = packets[si]
+            hdr = pp.hdr
+            sn = hdr.Segment_ID_Num
+            en = hdr.Event_ID_Num
             # find appropriate event in marker tables
-            for p in emarkertabs:
-                qq = self.packets[p]
-                mval1 = qq.tdat.tcontents[mkey1]
-                if qq.hdr.segmentnum == sn and mval1 == en:
-                    # this should be the correct event, extact values and compare
-                    mval2 = qq.tdat.tcontents[mkey2]
-                    mval3 = qq.tdat.tcontents[mkey3]
-                    mval4 = qq.tdat.tcontents[mkey4]
-                    mval5 = qq.tdat.tcontents[mkey5]
-                    mval6 = qq.tdat.tcontents[mkey6]
-                    tt = qq.hdr.timetag
-                    epos = self.packetstarts[p] - self.frontbytelen
-                    if val1 != mval2:
-                        etxt = ("Field 1, Event type (" + str(val1)
-                            + ") does not match corresponding value in Event " +
-                            "marker table (" + str(mval2) + ")")
-                        self.errors.adderror(self.errors.E_EVENTINDEX,
-                            self.errors.ELVL_LOW, ptext + etxt)
-                    if val2 != mval6:
-                        etxt = ("Field 2, Target Number (" + str(val2)
-                            + ") does not match corresponding value in Event " +
-                            "marker table (" + str(mval6) + ")")
-                        self.errors.adderror(self.errors.E_EVENTINDEX,
-                            self.errors.ELVL_LOW, ptext + etxt)
-                    if val7 != mval3:
-                        etxt = ("Field 7, Primary Sensor Number (" + str(val7)
-                            + ") does not match corresponding value in Event " +
-                            "marker table (" + str(mval3) + ")")
-                        self.errors.adderror(self.errors.E_EVENTINDEX,
-                            self.errors.ELVL_LOW, ptext + etxt)
-                    if val8 != mval4:
-                        etxt = ("Field 8, Secondary Sensor Number (" + str(val8)
-                            + ") does not match corresponding value in Event " +
-                            "marker table (" + str(mval4) + ")")
-                        self.errors.adderror(self.errors.E_EVENTINDEX,
-                            self.errors.ELVL_LOW, ptext + etxt)
-                    if val9 != mval5:
-                        etxt = ("Field 9, Third Sensor Number (" + str(val9)
-                            + ") does not match corresponding value in Event " +
-                            "marker table (" + str(mval5) + ")")
-                        self.errors.adderror(self.errors.E_EVENTINDEX,
-                            self.errors.ELVL_LOW, ptext + etxt)
-                    if val4 != tt:
-                        etxt = ("Field 4, Time Tag (" + str(val4)
-                            + ") does not match calculated value (" +
-                            str(tt) + ")")
-                        self.errors.adderror(self.errors.E_EVENTINDEX,
-                            self.errors.ELVL_LOW, ptext + etxt)
-                    if val10 != epos:
-                        etxt = ("Field 10, Event Position (" + str(val10)
-                            + ") does not match calculated value (" +
-                            str(epos) + ")")
-                        self.errors.adderror(self.errors.E_EVENTINDEX,
-                            self.errors.ELVL_LOW, ptext + etxt)
+            matches = markers.get((sn, en))
+            if not matches:
+                continue
+            # read in index table values
+            ivals = getivals(pp.tdat.tcontents)
+            val1, val2, val7, val8, val9, val4, val10 = ivals
+            # error texts are only built once a mismatch is found
+            mismatches = []
+            for p, mvals in matches:
+                # matching event, compare all fields at once and only unpick
+                # them on a mismatch
+                if ivals == mvals:
+                    continue
+                mval2, mval6, mval3, mval4, mval5, tt, epos = mvals
+                if val1 != mval2:
+                    mismatches.append(f"Field 1, Event type ({val1}) does "
+                        "not match corresponding value in Event marker table "
+                        f"({mval2})")
+                if val2 != mval6:
+                    mismatches.append(f"Field 2, Target Number ({val2}) does "
+                        "not match corresponding value in Event marker table "
+                        f"({mval6})")
+                if val7 != mval3:
+                    mismatches.append(f"Field 7, Primary Sensor Number ({val7}) "
+                        "does not match corresponding value in Event marker "
+                        f"table ({mval3})")
+                if val8 != mval4:
+                    mismatches.append(f"Field 8, Secondary Sensor Number "
+                        f"({val8}) does not match corresponding value in Event "
+                        f"marker table ({mval4})")
+                if val9 != mval5:
+                    mismatches.append(f"Field 9, Third Sensor Number ({val9}) "
+                        "does not match corresponding value in Event marker "
+                        f"table ({mval5})")
+                if val4 != tt:
+                    mismatches.append(f"Field 4, Time Tag ({val4}) does not "
+                        f"match calculated value ({tt})")
+                if val10 != epos:
+                    mismatches.append(f"Field 10, Event Position ({val10}) "
+                        f"does not match calculated value ({epos})")
+            if mismatches:
+                ptext = f"Packet {hdr.packetnum}({hdr.tablename}) - "
+                for etxt in mismatches:
+                    adderror(etype, elow, ptext + etxt)
         return
 
     def check_sensornumbersintables(self):
@@ -6576,83 +6828,86 @@ class Tablelist (NPIF):
         Event Index
         Virtual Sensor Definition
         """
+        adderror = self.errors.adderror
+        etype = self.errors.E_SENSORNUM
+        elow = self.errors.ELVL_LOW
         sengrptabs = self.packetdict[self.DT_Sensor_Grouping_DT]
         evemrktabs = self.packetdict[self.DT_Event_Marker_DT]
         eveindtabs = self.packetdict[self.DT_Event_Index_DT]
         virtsentabs = self.packetdict[self.DT_Virtual_Sensor_Def_DT]
+        sidset = frozenset(self.sensoridlist)
+        notinuse = self.TXT_NOTINUSE
+
+        # get relevant keys for each table type
+        grpkey = self.S7023_FLD_NAMES[self.DT_Sensor_Grouping_DT][4]
+        mrkkeys = self.S7023_FLD_NAMES[self.DT_Event_Marker_DT][2:5]
+        indkeys = self.S7023_FLD_NAMES[self.DT_Event_Index_DT][6:9]
+        virkeys = self.S7023_FLD_NAMES[self.DT_Virtual_Sensor_Def_DT][2:6]
+        packets = self.packets
+
+        # screen every referenced sensor number in one set operation - a
+        # record with no bad references needs no per-packet scan
+        if self._sensor_refs <= sidset:
+            return
 
         for p in sengrptabs:
             # is a list with multiple items
-            key = self.S7023_FLD_NAMES[self.DT_Sensor_Grouping_DT][4]
-            vals = self.packets[p].tdat.tcontents[key]
-            qq = self.packets[p]
-            ptext = ("Packet " + str(qq.hdr.packetnum) + "(" +
-                qq.hdr.tablename + ") - ")
-            for i, s in enumerate(vals):
-                if s not in self.sensoridlist:
-                    etxt = ("Field " + str(i+5) + ", Sensor Number, " + str(s)
-                        + ", is not a valid sensor number for this record")
-                    self.errors.adderror(self.errors.E_SENSORNUM,
-                        self.errors.ELVL_LOW, ptext + etxt)
+            qq = packets[p]
+            hdr = qq.hdr
+            vals = qq.tdat.tcontents[grpkey]
+            invalid = [(i, s) for i, s in enumerate(vals) if s not in sidset]
+            if not invalid:
+                continue
+            ptext = f"Packet {hdr.packetnum}({hdr.tablename}) - "
+            for i, s in invalid:
+                etxt = (f"Field {i+5}, Sensor Number, {s}, is not a valid "
+                    "sensor number for this record")
+                adderror(etype, elow, ptext + etxt)
         #
         for p in evemrktabs:
             # 3 number in table
-            key3 = self.S7023_FLD_NAMES[self.DT_Event_Marker_DT][2]
-            key4 = self.S7023_FLD_NAMES[self.DT_Event_Marker_DT][3]
-            key5 = self.S7023_FLD_NAMES[self.DT_Event_Marker_DT][4]
-            qq = self.packets[p]
-            val3 = qq.tdat.tcontents[key3]
-            val4 = qq.tdat.tcontents[key4]
-            val5 = qq.tdat.tcontents[key5]
-            vals = [val3, val4, val5]
-            ptext = ("Packet " + str(qq.hdr.packetnum) + "(" +
-                qq.hdr.tablename + ") - ")
-            for i, s in enumerate(vals):
-                if s not in self.sensoridlist:
-                    etxt = ("Field " + str(i+3) + ", Sensor Number, " + str(s)
-                        + ", is not a valid sensor number for this record")
-                    self.errors.adderror(self.errors.E_SENSORNUM,
-                        self.errors.ELVL_LOW, ptext + etxt)
+            qq = packets[p]
+            hdr = qq.hdr
+            tc = qq.tdat.tcontents
+            vals = [tc[k] for k in mrkkeys]
+            invalid = [(i, s) for i, s in enumerate(vals) if s not in sidset]
+            if not invalid:
+                continue
+            ptext = f"Packet {hdr.packetnum}({hdr.tablename}) - "
+            for i, s in invalid:
+                etxt = (f"Field {i+3}, Sensor Number, {s}, is not a valid "
+                    "sensor number for this record")
+                adderror(etype, elow, ptext + etxt)
         #
         for p in eveindtabs:
             # 3 numbers in table
-            key7 = self.S7023_FLD_NAMES[self.DT_Event_Index_DT][6]
-            key8 = self.S7023_FLD_NAMES[self.DT_Event_Index_DT][7]
-            key9 = self.S7023_FLD_NAMES[self.DT_Event_Index_DT][8]
-            qq = self.packets[p]
-            val7 = qq.tdat.tcontents[key7]
-            val8 = qq.tdat.tcontents[key8]
-            val9 = qq.tdat.tcontents[key9]
-            vals = [val7, val8, val9]
-            ptext = ("Packet " + str(qq.hdr.packetnum) + "(" +
-                qq.hdr.tablename + ") - ")
-            for i, s in enumerate(vals):
-                if s not in self.sensoridlist:
-                    etxt = ("Field " + str(i+7) + ", Sensor Number, " + str(s)
-                        + ", is not a valid sensor number for this record")
-                    self.errors.adderror(self.errors.E_SENSORNUM,
-                        self.errors.ELVL_LOW, ptext + etxt)
+            qq = packets[p]
+            hdr = qq.hdr
+            tc = qq.tdat.tcontents
+            vals = [tc[k] for k in indkeys]
+            invalid = [(i, s) for i, s in enumerate(vals) if s not in sidset]
+            if not invalid:
+                continue
+            ptext = f"Packet {hdr.packetnum}({hdr.tablename}) - "
+            for i, s in invalid:
+                etxt = (f"Field {i+7}, Sensor Number, {s}, is not a valid "
+                    "sensor number for this record")
+                adderror(etype, elow, ptext + etxt)
         #
         for p in virtsentabs:
             # 4 numbers in table - 65535 is possible entry meaning not in use
-            key3 = self.S7023_FLD_NAMES[self.DT_Virtual_Sensor_Def_DT][2]
-            key4 = self.S7023_FLD_NAMES[self.DT_Virtual_Sensor_Def_DT][3]
-            key5 = self.S7023_FLD_NAMES[self.DT_Virtual_Sensor_Def_DT][4]
-            key6 = self.S7023_FLD_NAMES[self.DT_Virtual_Sensor_Def_DT][5]
-            qq = self.packets[p]
-            val3 = qq.tdat.tcontents[key3]
-            val4 = qq.tdat.tcontents[key4]
-            val5 = qq.tdat.tcontents[key5]
-            val6 = qq.tdat.tcontents[key6]
-            vals = [val3, val4, val5, val6]
-            ptext = ("Packet " + str(qq.hdr.packetnum) + "(" +
-                qq.hdr.tablename + ") - ")
-            for i, s in enumerate(vals):
-                if s not in self.sensoridlist and s != self.TXT_NOTINUSE:
-                    etxt = ("Field " + str(i+3) + ", Sensor Number, " + str(s)
-                        + ", is not a valid sensor number for this record")
-                    self.errors.adderror(self.errors.E_SENSORNUM,
-                        self.errors.ELVL_LOW, ptext + etxt)
+            qq = packets[p]
+            hdr = qq.hdr
+            tc = qq.tdat.tcontents
+            vals = [tc[k] for k in virkeys]
+            invalid = [(i, s) for i, s in enumerate(vals) if s not in sidset and s != notinuse]
+            if not invalid:
+                continue
+            ptext = f"Packet {hdr.packetnum}({hdr.tablename}) - "
+            for i, s in invalid:
+                etxt = (f"Field {i+3}, Sensor Number, {s}, is not a valid "
+                    "sensor number for this record")
+                adderror(etype, elow, ptext + etxt)
         #
         return
 
@@ -6671,13 +6926,7 @@ class Tablelist (NPIF):
             self.errors.adderror(self.errors.E_TIMETAG,
                 self.errors.ELVL_WARN, etxt)
             return
-        ambleexist = 0
-        for p in tttabs:
-            if self.packets[p].hdr.segmentnum == 0:
-                if self.packets[p].hdr.ambleflag == 1:
-                    ambleexist = 1
-                    break
-        if not ambleexist:
+        if not self._timetag_in_preamble:
             etxt = ("No Format Time Tag Tables exist in the Preamble")
             self.errors.adderror(self.errors.E_TIMETAG,
                 self.errors.ELVL_WARN, etxt)
@@ -6688,22 +6937,18 @@ class Tablelist (NPIF):
         Checks if sensor ID tables exist for each sensor ID number identified
         in record.
         """
-        idtabs = self.packetdict[self.DT_Sensor_ID_DT]
-        senlist = list(self.sensoridlist)
-        senlist0 = list(self.sensoridlist)
-        for p in idtabs:
-            qq = self.packets[p]
-            if qq.hdr.Sensor_ID_Num in senlist:
-                senlist.remove(qq.hdr.Sensor_ID_Num)
-                if qq.hdr.segmentnum == 0:
-                    senlist0.remove(qq.hdr.Sensor_ID_Num)
+        found = self._senid_tab_ids
+        found0 = self._senid_tab_ids0
+        # keep file order of the sensor IDs for the messages
+        senlist = [s for s in self.sensoridlist if s not in found]
+        senlist0 = [s for s in self.sensoridlist if s not in found0]
         if len(senlist0):
-            etxt = ("Sensor IDs" + str(senlist0) + "do not have a Sensor " +
+            etxt = (f"Sensor IDs{senlist0}do not have a Sensor "
                 "Identification table in the preamble")
             self.errors.adderror(self.errors.E_SENSORNUM,
                 self.errors.ELVL_WARN, etxt)
         if len(senlist):
-            etxt = ("Sensor IDs" + str(senlist0) + "do not have a Sensor " +
+            etxt = (f"Sensor IDs{senlist}do not have a Sensor "
                 "Identification table in the record")
             self.errors.adderror(self.errors.E_SENSORNUM,
                 self.errors.ELVL_WARN, etxt)
@@ -6723,20 +6968,10 @@ class Tablelist (NPIF):
             self.errors.adderror(self.errors.E_DYNAMICTABS,
                 self.errors.ELVL_WARN, etxt)
             return
-        # calculate dicts with platform IDs as keys
-        mindict = collections.defaultdict(list)
-        compdict = collections.defaultdict(list)
-        for p in mindict:
-            pidn = self.packets[p].hdr.Platform_ID_Num
-            mindict[pidn].append(p)
-        for p in compdict:
-            pidn = self.packets[p].hdr.Platform_ID_Num
-            compdict[pidn].append(p)
-        #
-        commonids = set(mindict) & set(compdict)
+        commonids = self._plat_ids_min & self._plat_ids_comp
         for i in commonids:
-            etxt = ("Platform ID, " + str(i) + " Uses both Comprehensive and" +
-                " Minimum Dynamic Platform Tables")
+            etxt = (f"Platform ID, {i} Uses both Comprehensive and Minimum "
+                "Dynamic Platform Tables")
             self.errors.adderror(self.errors.E_DYNAMICTABS,
                 self.errors.ELVL_LOW, etxt)
         return
@@ -6755,20 +6990,10 @@ class Tablelist (NPIF):
             self.errors.adderror(self.errors.E_SENATTTABS,
                 self.errors.ELVL_WARN, etxt)
             return
-        # calculate dicts with sensor IDs as keys
-        mindict = collections.defaultdict(list)
-        compdict = collections.defaultdict(list)
-        for p in mindict:
-            pidn = self.packets[p].hdr.Sensor_ID_Num
-            mindict[pidn].append(p)
-        for p in compdict:
-            pidn = self.packets[p].hdr.Sensor_ID_Num
-            compdict[pidn].append(p)
-        #
-        commonids = set(mindict) & set(compdict)
+        commonids = self._sen_ids_minatt & self._sen_ids_compatt
         for i in commonids:
-            etxt = ("Sensor ID, " + str(i) + " uses both Comprehensive and" +
-                " Minimum Sensor Attitude Tables")
+            etxt = (f"Sensor ID, {i} uses both Comprehensive and Minimum "
+                "Sensor Attitude Tables")
             self.errors.adderror(self.errors.E_SENATTTABS,
                 self.errors.ELVL_LOW, etxt)
         return
@@ -6782,28 +7007,17 @@ class Tablelist (NPIF):
         # do not warn about no use of either - it is possible to describe
         # sensor views without useage of gimbals tables
         #
-        # calculate dicts with sensor IDs as keys, but also need gimbal ID
-        mindict = collections.defaultdict(list)
-        compdict = collections.defaultdict(list)
-        for p in mindict:
-            sidn = self.packets[p].hdr.Sensor_ID_Num
-            gidn = self.packets[p].hdr.Gimbal_ID_Num
-            mindict[sidn].append(gidn)
-        for p in compdict:
-            sidn = self.packets[p].hdr.Sensor_ID_Num
-            gidn = self.packets[p].hdr.Gimbal_ID_Num
-            compdict[sidn].append(gidn)
+        # dicts with sensor IDs as keys and sets of gimbal IDs as values
+        mindict = self._gimbals_min
+        compdict = self._gimbals_comp
         #
-        commonids = set(mindict) & set(compdict)
+        commonids = mindict.keys() & compdict.keys()
         for i in commonids:
             # also unpick by Gimbal ID
-            ming = mindict[i]
-            compg = compdict[i]
-            commongimb = set(ming) & set(compg)
+            commongimb = mindict[i] & compdict[i]
             for j in commongimb:
-                etxt = ("Sensor ID, " + str(i) + ", Gimbal ID, " + str(j) +
-                     " uses both Comprehensive and Minimum Gimbal Attitude" +
-                     " Tables")
+                etxt = (f"Sensor ID, {i}, Gimbal ID, {j} uses both "
+                    "Comprehensive and Minimum Gimbal Attitude Tables")
                 self.errors.adderror(self.errors.E_GIMBALTABS,
                     self.errors.ELVL_LOW, etxt)
         return
@@ -6823,23 +7037,27 @@ def Do_7023_Full(fname):
     summaryout = noext + '_summary.txt'
     tablesout = noext + '_tables.csv'
     testsout = noext + '_tests.txt'
-    #
-    # open output files for writing
-    sout = open(summaryout, 'w')
-    tabout = open(tablesout, 'w')
-    tstout = open(testsout, 'w')
+    # large write buffer, the table output is written in many small pieces
+    bufsize = 1 << 20
     #
     # read in the file
     a.Open_7023_File(fname)
-    # add contents to 1st output file (summary)
-    a.Print_Basic_File_Data(obuf=sout)
-    sout.close()
-    # add contents to 2nd output file (csv detail)
-    a.Print_All_Tables(obuf=tabout, detail=True, strictcsv=True)
-    #a.Print_All_Tables(obuf=tabout, detail=False, strictcsv=True)
-    tabout.close()
-    # add contents to 3rd output file (simple analysis)
-    a.file_error_checks()
-    a.printallerrorssorted(obuf=tstout)
-    tstout.close()
+    # the three outputs only read the loaded tables (the error checks add to
+    # a.errors, which the other two do not use) so write them side by side
+    with open(summaryout, 'w', buffering=bufsize) as sout, \
+            open(tablesout, 'w', buffering=bufsize) as tabout, \
+            open(testsout, 'w', buffering=bufsize) as tstout, \
+            concurrent.futures.ThreadPoolExecutor(max_workers=2) as ex:
+        # add contents to 1st output file (summary)
+        f1 = ex.submit(a.Print_Basic_File_Data, obuf=sout)
+        # add contents to 2nd output file (csv detail)
+        f2 = ex.submit(a.Print_All_Tables, obuf=tabout, detail=True,
+            strictcsv=True)
+        #a.Print_All_Tables(obuf=tabout, detail=False, strictcsv=True)
+        # add contents to 3rd output file (simple analysis)
+        a.file_error_checks()
+        a.printallerrorssorted(obuf=tstout)
+        # re-raise anything that went wrong in the workers
+        f1.result()
+        f2.result()
     #
@@ -49,6 +49,8 @@ fpanframe16_GOLDEN = 'U:\\My Documents\\pan-frame-16.7023'
 # destination folder for generated files
 NPIF_data_folder_out = 'U:\\My Documents\\npiftest'
 
+import mmap
+import os
 import sys
 if '../' not in sys.path:
     sys.path.append('../')
@@ -70,6 +72,51 @@ def Do_7023_FullX(fname):
     #
 
 
+def copy_packets(tlist, src, plist, dest, extra=0):
+    """
+    Copies packets (numbered as in Tablelist tlist) from the open 7023 file
+    src to the end of the open file dest. Each packet is claimlen plus extra
+    bytes long, and packets that follow on from each other in src are copied
+    as one run.
+
+    Uses os.sendfile so the bytes are copied by the kernel, falling back to
+    slices of a read-only mmap of src where that is not supported. dest is
+    flushed once, before any copying, so sendfile output lands after earlier
+    buffered writes. After a fallback, only buffered writes are made.
+    """
+    starts = tlist.packetstarts
+    packets = tlist.packets
+    runs = []
+    for p in plist:
+        start = starts[p]
+        end = start + packets[p].hdr.claimlen + extra
+        if runs and runs[-1][1] == start:
+            runs[-1][1] = end
+        else:
+            runs.append([start, end])
+    dest.flush()
+    mm = None
+    try:
+        for start, end in runs:
+            if mm is None:
+                try:
+                    while start < end:
+                        sent = os.sendfile(dest.fileno(), src.fileno(), start,
+                            end - start)
+                        if sent == 0:
+                            break
+                        start += sent
+                    continue
+                except (AttributeError, OSError):
+                    # stay on the mmap path from here on, a later sendfile
+                    # would go to the file ahead of the buffered writes
+                    mm = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+            dest.write(mm[start:end])
+    finally:
+        if mm is not None:
+            mm.close()
+
+
 def maketestf():
     """
     Crude function to generate sample packet for every table type.
@@ -92,108 +139,120 @@ def maketestf():
     reserved=b"\x00\x00\x00\x00\x00"
     crc=b"\xab\xcd"
     data=b"\x00\x02\x03\x00\x05\x09"
+    # only sa, dfa and size change between packets, so build the header
+    # once and patch those three fields into a copy for each packet
+    tmpl = bytearray(qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc)
+    o = len(qqq.SYNC_FIELD) + 3
+
+    def packet(sa, dfa, size, data):
+        hdr = tmpl[:]
+        hdr[o:o+1] = sa
+        hdr[o+1:o+5] = dfa
+        hdr[o+5:o+9] = size
+        hdr += data
+        return bytes(hdr)
 
-    sensorgrouping=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    sensorgrouping=packet(sa, dfa, size, data)
     sa=b"\x3f"
     dfa=b"\x00\x00\x00\xbb"
     size=b"\x00\x00\x00\x0f"
     data=b"\x00"*15
-    userdefined=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    userdefined=packet(sa, dfa, size, data)
     sa=b"\x50"
     dfa=b"\x00\x00\x00\x30"
     size=b"\x00\x00\x00\x48"
-    data=struct.pack('>ddddddddd', 1.0, 1.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0)
-    compsensatt=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    data=struct.pack('>9d', 1.0, 1.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0)
+    compsensatt=packet(sa, dfa, size, data)
     sa=b"\x50"
     dfa=b"\x00\x00\x00\x53"
     size=b"\x00\x00\x00\x18"
-    data=struct.pack('>ddd', 11.0, 12.0, 13.0)
-    gimbpos=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    data=struct.pack('>3d', 11.0, 12.0, 13.0)
+    gimbpos=packet(sa, dfa, size, data)
     sa=b"\x50"
     dfa=b"\x00\x00\x00\x72"
     size=b"\x00\x00\x00\x48"
-    data=struct.pack('>ddddddddd', 1.0, 1.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0)
-    compgimbatt=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    data=struct.pack('>9d', 1.0, 1.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0)
+    compgimbatt=packet(sa, dfa, size, data)
     sa=b"\x50"
     dfa=b"\x00\x00\x10\x10"
     size=b"\x00\x00\x00\x13"
     data=b"\x00\x0c\x00\x20\x03\x20\x03\x0c\x00\x20\x03\x20\x03\x0c\x00\x20\x03\x20\x03"
-    senssampcoorddes=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    senssampcoorddes=packet(sa, dfa, size, data)
     sa=b"\x50"
     dfa=b"\x00\x00\x10\x20"
     size=b"\x00\x00\x00\x07"
     data=b"\x00\x00\x00\x00\x00\x00\x00"
-    senssamptimedes=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    senssamptimedes=packet(sa, dfa, size, data)
     sa=b"\x55"
     dfa=b"\x00\x01\x00\x01"
     size=b"\x00\x00\x00\x1d"
     data=b"\x00\x00\x00\xff\x00\x00\x00\xff\x00\x00\x00\x40\x00\x00\x00\x80\x00\x00\x00\x80\x00\x05\x01\x00\x10\x00\x08\x04\x02"
-    radsendes=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    radsendes=packet(sa, dfa, size, data)
     sa=b"\x55"
     dfa=b"\x00\x01\x03\x00"
     size=b"\x00\x00\x00\x21"
-    data=struct.pack('>dddd', 1.5, 2.5, 3.5, 4.5)+b"\x01"
-    radcolplngeo=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    data=struct.pack('>4dc', 1.5, 2.5, 3.5, 4.5, b"\x01")
+    radcolplngeo=packet(sa, dfa, size, data)
     sa=b"\x55"
     dfa=b"\x00\x01\x03\x01"
     size=b"\x00\x00\x00\x48"
-    data=struct.pack('>dd', math.pi/4, math.pi/4)+b"\xff"*24+struct.pack('>dddd', 1.1, 2.1, 3.1, 4.1)
-    reftrack=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    data=struct.pack('>2d24s4d', math.pi/4, math.pi/4, b"\xff"*24, 1.1, 2.1, 3.1, 4.1)
+    reftrack=packet(sa, dfa, size, data)
     sa=b"\x55"
     dfa=b"\x00\x01\x03\x02"
     size=b"\x00\x00\x00\xe2"
-    data=struct.pack('>ddddddddddd', 1.1,2.1,3.1,4.1,5.1,6.1,7.1,8.1,9.1,10.1,11.1)+b"\xff"*8*15 + struct.pack('>dd', 0.5, 0.5)+b"\x02\x01"
-    rectimgeo=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    data=struct.pack('>11d120s2d2s', 1.1,2.1,3.1,4.1,5.1,6.1,7.1,8.1,9.1,10.1,11.1, b"\xff"*8*15, 0.5, 0.5, b"\x02\x01")
+    rectimgeo=packet(sa, dfa, size, data)
     sa=b"\x56"
     dfa=b"\x00\x01\x03\x03"
     size=b"\x00\x00\x00\x19"
-    data=struct.pack('>dd', 0.0,0.0)+b"\x00\x01\xff\xff\x00\x03\xff\xff\x00"
-    virtualsendef=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    data=struct.pack('>2d9s', 0.0,0.0, b"\x00\x01\xff\xff\x00\x03\xff\xff\x00")
+    virtualsendef=packet(sa, dfa, size, data)
     sa=b"\x55"
     dfa=b"\x00\x01\x03\x04"
     size=b"\x00\x00\x00\x7a"
-    data=struct.pack('>ddddddddddddd', 1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0)+b"\x00\x00\x00\x0a\x00\x0a\x00\x0a\x40\x00\x01\x02\x03\x04\x05\x06\x07\x08"
-    radarparam=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    data=struct.pack('>13d18s', 1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0, b"\x00\x00\x00\x0a\x00\x0a\x00\x0a\x40\x00\x01\x02\x03\x04\x05\x06\x07\x08")
+    radarparam=packet(sa, dfa, size, data)
     sa=b"\x55"
     dfa=b"\x00\x01\x03\x05"
     size=b"\x00\x00\x00\x17"
-    data=struct.pack('>dd', 1.0,1.0)+b"\x00\x00\x00\x0a\x01\x02\x01"
-    isar=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    data=struct.pack('>2d7s', 1.0,1.0, b"\x00\x00\x00\x0a\x01\x02\x01")
+    isar=packet(sa, dfa, size, data)
     sa=b"\x55"
     dfa=b"\x00\x01\x10\x00"
     size=b"\x00\x00\x00\x53"
-    data=b"\x0c\x00\x00\x00\x00\x00\x00\x02"+struct.pack('>ddddddddd', 1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0)+b"\x01\x03\x00"
-    radel=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    data=struct.pack('>8s9d3s', b"\x0c\x00\x00\x00\x00\x00\x00\x02", 1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0, b"\x01\x03\x00")
+    radel=packet(sa, dfa, size, data)
     sa=b"\xbc"
     dfa=b"\x00\x00\x00\x10"
     size=b"\x00\x00\x00\x28"
     data = b"\x00" * 40
-    sensampx=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    sensampx=packet(sa, dfa, size, data)
     dfa=b"\x00\x00\x00\x20"
-    sensampy=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    sensampy=packet(sa, dfa, size, data)
     dfa=b"\x00\x00\x00\x30"
-    sensampz=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    sensampz=packet(sa, dfa, size, data)
     dfa=b"\x00\x00\x00\x50"
-    sensampt=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    sensampt=packet(sa, dfa, size, data)
     dfa=b"\x00\x00\x00\x60"
-    gmti=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    gmti=packet(sa, dfa, size, data)
     dfa=b"\x00\x00\x00\x70"
-    mi=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    mi=packet(sa, dfa, size, data)
     dfa=b"\x00\x00\x00\x80"
     size=b"\x00\x00\x00\x08"
     data=struct.pack('>d', 1.0)
-    rangef=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    rangef=packet(sa, dfa, size, data)
     sa=b"\x55"
     dfa=b"\x00\x00\x01\x03"
     size=b"\x00\x00\x00\x09"
     data=b"\x01\x00\x08\x00\x40\x00\x20\x01\x0a"
-    j2kdes=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    j2kdes=packet(sa, dfa, size, data)
     # finally jpeg2000 index table
     sa=b"\x60"
     dfa=b"\x00\x00\x01\x04"
     size=b"\x00\x00\x00\x28"
     data = b"\x00" * 40
-    j2kindex=qqq.SYNC_FIELD+edition+flags+segnum+sa+dfa+size+dfn+time+sync+reserved+crc+data
+    j2kindex=packet(sa, dfa, size, data)
     #
     #
     line8=Tablelist()
@@ -217,52 +276,20 @@ def maketestf():
     fp16 = open(f7, 'rb')
     fp64 = open(f3, 'rb')
     #
-    newout = open(NPIF_data_folder_out + '\\test.7023', 'wb')
-    for p in p16:
-        start=panf16.packetstarts[p]
-        plength=panf16.packets[p].hdr.claimlen
-        fp16.seek(start)
-        print("aaa", plength)
-        mstr = fp16.read(plength)
-        newout.write(mstr)
-    for p in p64:
-        start=sen64.packetstarts[p]
-        plength=sen64.packets[p].hdr.claimlen
-        fp64.seek(start)
-        mstr = fp64.read(plength)
-        newout.write(mstr)
+    # large write buffer so the made-up tables (and, without sendfile, the
+    # copied packets) go to disk in a few big writes
+    newout = open(os.path.join(NPIF_data_folder_out, 'test.7023'), 'wb',
+        buffering=1 << 20)
+    copy_packets(panf16, fp16, p16, newout)
+    copy_packets(sen64, fp64, p64, newout)
     #
-    newout.write(sensorgrouping)
-    newout.write(userdefined)
-    newout.write(compsensatt)
-    newout.write(gimbpos)
-    newout.write(compgimbatt)
-    newout.write(senssampcoorddes)
-    newout.write(senssamptimedes)
-    newout.write(radsendes)
-    newout.write(radcolplngeo)
-    newout.write(reftrack)
-    newout.write(rectimgeo)
-    newout.write(virtualsendef)
-    newout.write(radarparam)
-    newout.write(isar)
-    newout.write(radel)
-    newout.write(sensampx)
-    newout.write(sensampy)
-    newout.write(sensampz)
-    newout.write(sensampt)
-    newout.write(gmti)
-    newout.write(mi)
-    newout.write(rangef)
-    newout.write(j2kdes)
-    newout.write(j2kindex)
+    newout.writelines([sensorgrouping, userdefined, compsensatt, gimbpos,
+        compgimbatt, senssampcoorddes, senssamptimedes, radsendes,
+        radcolplngeo, reftrack, rectimgeo, virtualsendef, radarparam, isar,
+        radel, sensampx, sensampy, sensampz, sensampt, gmti, mi, rangef,
+        j2kdes, j2kindex])
     #
-    for p in p8:
-        start=line8.packetstarts[p]
-        plength=line8.packets[p].hdr.claimlen
-        fp8.seek(start)
-        mstr = fp8.read(plength)
-        newout.write(mstr)
+    copy_packets(line8, fp8, p8, newout)
     #
     fp8.close()
     fp64.close()
@@ -270,45 +297,40 @@ def maketestf():
     newout.close()
 
 def maketestf2():
-    # make a dud file
-    dud = open(NPIF_data_folder_out + '\\test2.7023', 'wb')
-    mstr = b"\x00" * 1000
-    dud.write(mstr)
-    dud.close()
+    # make a dud file of 1000 zero bytes
+    with open(os.path.join(NPIF_data_folder_out, 'test2.7023'), 'wb') as dud:
+        dud.truncate(1000)
 
 def maketestf3():
     # create a file that just repeats a few tables
-    t1 = NPIF_data_folder_out + '\\test.7023'
+    t1 = os.path.join(NPIF_data_folder_out, 'test.7023')
 
     a = Tablelist()
     a.Open_7023_File(t1)
     wantedp=[29, 30, 31, 36, 40, 52, 53, 3, 29, 30, 31, 36, 40, 52, 53, 3, 29, 30, 31, 36, 40, 52, 53, 3, 51, 56]
-    newout = open(NPIF_data_folder_out + '\\test3.7023', 'wb')
+    newout = open(os.path.join(NPIF_data_folder_out, 'test3.7023'), 'wb')
     oldtest = open(t1, 'rb')
     # put some dud bytes up front
     newout.write(b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00")
-    for p in wantedp:
-        start=a.packetstarts[p]
-        length=a.packets[p].hdr.claimlen+3
-        oldtest.seek(start)
-        mstr = oldtest.read(length)
-        newout.write(mstr)
+    copy_packets(a, oldtest, wantedp, newout, extra=3)
     newout.close()
     oldtest.close()
 
 def generate_test_samples():
-    testfile = NPIF_data_folder_out + '/test.7023'
+    testfile = os.path.join(NPIF_data_folder_out, 'test.7023')
     a = Tablelist()
     a.Open_7023_File(testfile)
-    outname = NPIF_data_folder_out + '/testPrint_All_Tables_Neat1.txt'
+    outname = os.path.join(NPIF_data_folder_out,
+        'testPrint_All_Tables_Neat1.txt')
     outfile = open(outname, 'w')
     a.Print_All_Tables(detail=True, strictcsv=True, obuf=outfile)
     outfile.close()
-    outname = NPIF_data_folder_out + '/testPrint_All_Tables_Neat2.txt'
+    outname = os.path.join(NPIF_data_folder_out,
+        'testPrint_All_Tables_Neat2.txt')
     outfile = open(outname, 'w')
     a.Print_All_Tables(detail=False, strictcsv=True, obuf=outfile)
     outfile.close()
-    outname = NPIF_data_folder_out + '/testPrint_Table_Summary.txt'
+    outname = os.path.join(NPIF_data_folder_out, 'testPrint_Table_Summary.txt')
     outfile = open(outname, 'w')
     a.Print_Table_Summary(obuf=outfile)
     outfile.close()
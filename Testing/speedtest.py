@@ -60,21 +60,31 @@ def runlots():
     for f in goldenlist:
         allfiles.append(baselocation + f)
 
-    start = time.time()
+    start = time.perf_counter()
+    cstart = time.process_time()
 
     for f in allfiles :
-        lstart = time.time()
+        lstart = time.perf_counter()
+        lcstart = time.process_time()
         print(f)
         NPIF.Do_7023_Full(f)
-        lend = time.time()
-        print("...",lend - lstart,"seconds")
+        lend = time.perf_counter()
+        lcend = time.process_time()
+        print("...",lend - lstart,"seconds (cpu",lcend - lcstart,"seconds)")
         
-    end = time.time()
-    print("Total Time",end - start,"seconds")
+    end = time.perf_counter()
+    cend = time.process_time()
+    print("Total Time",end - start,"seconds (cpu",cend - cstart,"seconds)")
     
 
 if __name__ == '__main__':
-    cProfile.run("runlots()")
+    # save the profile rather than printing it, browse it afterwards with
+    # python -m pstats speedtest.pstats (or snakeviz speedtest.pstats)
+    prof = cProfile.Profile()
+    prof.enable()
+    runlots()
+    prof.disable()
+    prof.dump_stats('speedtest.pstats')
     #runlots()
     #
     
\ No newline at end of file